@@ -1,4 +1,5 @@
 from .cpu import CPU
+from .machine import Machine
 from .memory import Memory
 
-__all__ = ["CPU", "Memory"]
+__all__ = ["CPU", "Machine", "Memory"]
@@ -1,47 +1,99 @@
 import argparse
 import logging
 import time
+from functools import partial
 from pathlib import Path
 
 import numpy as np
 
+from .cache import DEFAULT_CACHE_DIR, RomCache
+from .capture import FrameCapture
+from .constants import TICKS_PER_SECOND
 from .cpu import CPU
 from .data import read_rom
 from .debug import DebugInformation, DebugPipe
-from .graphics import Display
+from .latency import LatencyTrace
 from .memory import Memory
+from .monitor import MemoryMonitor, TracedMemory
+from .quirks import QUIRK_PROFILES
+from .screen import Screen
 from .sound import Sound
 
 np.seterr(over="ignore")
 logging.basicConfig(level=logging.WARNING)
 
-TICKS_PER_SECOND = 200
-
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Run rom")
     parser.add_argument("rom", type=Path)
+    parser.add_argument("--capture", type=Path, help="record frames to a .gif file or a directory of .png files")
+    parser.add_argument("--capture-every", type=int, default=1, help="only record every n-th frame")
+    parser.add_argument("--quirks", choices=QUIRK_PROFILES, default="default", help="compatibility profile")
+    parser.add_argument("--trace-latency", type=Path, help="trace key press latencies and write them to a json file")
+    parser.add_argument("--terminal", action="store_true", help="render in the terminal instead of a window")
+    parser.add_argument("--cache-dir", type=Path, default=DEFAULT_CACHE_DIR, help="where rom analyses are cached")
     args = parser.parse_args()
+    if args.terminal and args.trace_latency:
+        parser.error("--trace-latency needs the window frontend, it can't be used with --terminal")
 
     rom_file: Path = args.rom
+    rom_data = read_rom(rom_file)
     memory = Memory()
-    memory.load_rom(read_rom(rom_file))
     debug_pipe = DebugPipe()
-    debug_info = DebugInformation.create_process_synced()
-    display = Display(debug_info, debug_pipe)
+    debug_info: DebugInformation | None = None
+    capture = FrameCapture(args.capture, args.capture_every) if args.capture else None
+    latency_trace: LatencyTrace | None = None
+    memory_monitor: MemoryMonitor | None = None
     sound = Sound()
-    cpu = CPU(memory, display, sound, debug_info, debug_pipe)
-
-    while True:
-        if -1 in display.pressed_buttons():
-            break
-        debug_pipe.fetch_messages()
-        if not debug_pipe.paused or debug_pipe.open_steps():
-            cpu.tick()
-        if debug_pipe.should_reset():
-            cpu.reset()
-            display.clear()
-            cpu.tick()
-        time.sleep(1 / TICKS_PER_SECOND)
-
-    sound.close()
-    display.close()
+    display: Screen
+    if args.terminal:
+        # termios/tty are only needed when rendering to the terminal
+        from .terminal import TerminalDisplay
+
+        # log messages would go to the same tty and end up on top of the frame
+        logging.disable(logging.CRITICAL)
+        display = TerminalDisplay(capture)
+    else:
+        # the window frontend pulls in moderngl/imgui and sets up shared memory on import
+        from .graphics import Display
+
+        debug_info = DebugInformation.create_process_synced()
+        latency_trace = LatencyTrace() if args.trace_latency else None
+        memory_monitor = MemoryMonitor()
+        memory = TracedMemory(memory_monitor)
+        # the debugger lists the disassembly once it is opened, warm starts read it from the cache
+        load_analysis = partial(RomCache(args.cache_dir).load, rom_data)
+        display = Display(debug_info, debug_pipe, capture, latency_trace, memory_monitor, load_analysis)
+    # the terminal has to be restored and the shared memory released even if the rom crashes or on ctrl-c
+    try:
+        memory.load_rom(rom_data)
+        cpu = CPU(memory, display, sound, debug_info, debug_pipe, QUIRK_PROFILES[args.quirks])
+
+        while True:
+            if -1 in display.pressed_buttons():
+                break
+            debug_pipe.fetch_messages()
+            command = debug_pipe.next_command()
+            if command:
+                cpu.run_command(*command)
+                cpu.publish_debug_info()
+            elif not debug_pipe.paused or debug_pipe.open_steps():
+                cpu.tick()
+                cpu.publish_debug_info()
+            if debug_pipe.should_reset():
+                cpu.reset()
+                display.clear()
+                cpu.tick()
+                cpu.publish_debug_info()
+            time.sleep(1 / TICKS_PER_SECOND)
+    finally:
+        sound.close()
+        display.close()
+        if capture:
+            capture.close()
+        if latency_trace:
+            latency_trace.dump(args.trace_latency)
+            latency_trace.close()
+            latency_trace.unlink()
+        if memory_monitor:
+            memory_monitor.close()
+            memory_monitor.unlink()
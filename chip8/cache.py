@@ -0,0 +1,55 @@
+import hashlib
+import json
+import os
+from contextlib import suppress
+from pathlib import Path
+
+import numpy as np
+import numpy.typing as npt
+
+from .decode import DECODER_VERSION, CodeAnalysis, analyze
+
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "chip8-emu"
+
+
+def rom_hash(rom_data: npt.NDArray[np.uint8]) -> str:
+    return hashlib.sha256(rom_data.tobytes()).hexdigest()
+
+
+class RomCache:
+    def __init__(self, directory: Path = DEFAULT_CACHE_DIR) -> None:
+        self.directory = directory
+
+    def load(self, rom_data: npt.NDArray[np.uint8]) -> CodeAnalysis:
+        key = rom_hash(rom_data)
+        analysis = self.read(key)
+        if analysis is None:
+            analysis = analyze(rom_data)
+            # the cache is only an optimisation, an unwritable cache directory must not stop the caller
+            with suppress(OSError):
+                self.write(key, analysis)
+        return analysis
+
+    def read(self, key: str) -> CodeAnalysis | None:
+        try:
+            meta = json.loads((self.directory / f"{key}.json").read_text())
+            if meta["version"] != DECODER_VERSION:
+                return None
+            # the code table is memory-mapped, pages are only read when they are accessed
+            code = np.load(self.directory / f"{key}.npy", mmap_mode="r")
+        except (OSError, ValueError, KeyError):
+            return None
+        return CodeAnalysis(code, meta["disassembly"])
+
+    def write(self, key: str, analysis: CodeAnalysis) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        code_file = self.directory / f"{key}.npy"
+        meta_file = self.directory / f"{key}.json"
+        code_tmp = code_file.with_suffix(f".{os.getpid()}.npy.tmp")
+        meta_tmp = meta_file.with_suffix(f".{os.getpid()}.json.tmp")
+        with code_tmp.open("wb") as f:
+            np.save(f, np.asarray(analysis.code))
+        meta_tmp.write_text(json.dumps({"version": DECODER_VERSION, "disassembly": analysis.disassembly}))
+        # replace the json file last, it marks the entry as complete for concurrent runs
+        code_tmp.replace(code_file)
+        meta_tmp.replace(meta_file)
@@ -0,0 +1,115 @@
+import logging
+import signal
+from multiprocessing import Process, Queue
+from pathlib import Path
+from queue import Full
+from typing import BinaryIO
+
+import numpy as np
+import numpy.typing as npt
+from PIL import GifImagePlugin, Image
+
+from .constants import HEIGHT, TICKS_PER_SECOND, WIDTH
+
+QUEUE_SIZE = 1024
+SCALE = 8
+
+
+class FrameCapture:
+    def __init__(self, path: Path, every: int = 1, scale: int = SCALE) -> None:
+        assert every >= 1
+        self.every = every
+        self.ticks = 0
+        self.frames = 0
+        self.dropped = 0
+        self.queue: "Queue[tuple[int, bytes | None]]" = Queue(maxsize=QUEUE_SIZE)
+        self.process = Process(target=encode_frames, args=[self.queue, path, scale])
+        self.process.start()
+
+    def capture(self, screen: npt.ArrayLike) -> None:
+        tick = self.ticks
+        self.ticks += 1
+        if tick % self.every:
+            return
+        self.frames += 1
+        frame = np.packbits(np.asarray(screen, dtype=np.bool_)).tobytes()
+        # never block the emulation: frames that don't fit into the queue are dropped
+        try:
+            self.queue.put_nowait((tick, frame))
+        except Full:
+            self.dropped += 1
+
+    def skip(self) -> None:
+        # ticks that don't show anything, e.g. while waiting for a key, still count for the frame durations
+        self.ticks += 1
+
+    def close(self) -> None:
+        self.queue.put((self.ticks, None))
+        self.process.join()
+        if self.dropped:
+            logging.warning("Frame capture dropped %d of %d frames", self.dropped, self.frames)
+
+
+def encode_frames(queue: "Queue[tuple[int, bytes | None]]", path: Path, scale: int) -> None:
+    # ctrl-c reaches the whole process group, the encoder finishes the file once the emulator sends the sentinel
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    writer = GifWriter(path, scale) if path.suffix.lower() == ".gif" else PngSequenceWriter(path, scale)
+    last_tick, last_frame = 0, None
+    while True:
+        tick, frame = queue.get(block=True, timeout=None)
+        if frame is not None and frame == last_frame:
+            # identical frames are merged into the duration of the first one
+            continue
+        if last_frame is not None:
+            writer.add(last_frame, last_tick, tick - last_tick)
+        if frame is None:
+            break
+        last_tick, last_frame = tick, frame
+    writer.close()
+
+
+def frame_to_image(frame: bytes, scale: int) -> Image.Image:
+    pixels = np.unpackbits(np.frombuffer(frame, dtype=np.uint8))[: WIDTH * HEIGHT].reshape(HEIGHT, WIDTH)
+    image = Image.fromarray(pixels * np.uint8(255))
+    return image.resize((WIDTH * scale, HEIGHT * scale), Image.Resampling.NEAREST)
+
+
+class PngSequenceWriter:
+    def __init__(self, directory: Path, scale: int) -> None:
+        self.directory = directory
+        self.scale = scale
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def add(self, frame: bytes, tick: int, ticks: int) -> None:  # noqa: ARG002
+        # the duration of a frame is implied by the tick of the next file
+        frame_to_image(frame, self.scale).save(self.directory / f"frame_{tick:08d}.png")
+
+    def close(self) -> None:
+        pass
+
+
+class GifWriter:
+    def __init__(self, path: Path, scale: int) -> None:
+        self.path = path
+        self.scale = scale
+        self.file: BinaryIO | None = None
+
+    def add(self, frame: bytes, tick: int, ticks: int) -> None:
+        # gif frame durations are stored in centiseconds, round the timestamps to avoid drift
+        start = round(tick * 100 / TICKS_PER_SECOND)
+        end = round((tick + ticks) * 100 / TICKS_PER_SECOND)
+        if start == end:
+            return
+        # every frame is appended to the file right away, nothing is kept in memory
+        image = frame_to_image(frame, self.scale)
+        if self.file is None:
+            self.file = self.path.open("wb")
+            header, _ = GifImagePlugin.getheader(image, info={"loop": 0})
+            self.file.write(b"".join(header))
+        self.file.write(b"".join(GifImagePlugin.getdata(image, duration=(end - start) * 10)))
+
+    def close(self) -> None:
+        if self.file is None:
+            return
+        self.file.write(b";")  # gif trailer
+        self.file.close()
@@ -1,2 +1,5 @@
 WIDTH = 64
 HEIGHT = 32
+TICKS_PER_SECOND = 200
+FRAMES_PER_SECOND = 60
+TICKS_PER_FRAME = round(TICKS_PER_SECOND / FRAMES_PER_SECOND)
@@ -3,24 +3,40 @@
 
 import logging
 import random
+from collections.abc import Callable
+from typing import TYPE_CHECKING
 
 import numpy as np
+import numpy.typing as npt
 
+from . import debug
+from .constants import TICKS_PER_FRAME
 from .debug import DebugInformation, DebugPipe
-from .graphics import Display
+from .decode import INSTRUCTIONS, KIND_TABLE
 from .memory import MEMORY_START_ROM, Memory
-from .sound import Sound
-from .utils import display_bytes, read_address, read_byte, read_half_byte
+from .quirks import QUIRK_PROFILES, IndexIncrement, Quirks
+from .screen import Screen
+from .utils import display_bytes
+
+if TYPE_CHECKING:
+    from .sound import SilentSound, Sound
+
+Handler = Callable[[int], None]
+
+# upper bound for batched debugger commands whose stop condition is never met
+MAX_RUN_TICKS = 100_000
+DRAW_KINDS = {INSTRUCTIONS.index("Dxyn"), INSTRUCTIONS.index("00E0")}
 
 
 class CPU:
     def __init__(  # noqa: PLR0913
         self,
         memory: Memory,
-        display: Display,
-        sound: Sound,
-        debug_info: DebugInformation,
-        debug_pipe: DebugPipe,
+        display: Screen,
+        sound: "Sound | SilentSound",
+        debug_info: DebugInformation | None = None,
+        debug_pipe: DebugPipe | None = None,
+        quirks: Quirks = QUIRK_PROFILES["default"],
     ) -> None:
         self.memory = memory
         self.display = display
@@ -34,22 +50,20 @@ class CPU:
         self.register_PC = np.uint16(MEMORY_START_ROM)  # 12 bits
         self.stack: list[np.uint16] = []
         self.wait_for_input_reg: str = ""
+        self.rng = random.Random()  # noqa: S311
+        self.quirks = quirks
+        self.draw: Callable[[np.uint8, np.uint8, npt.NDArray[np.uint8]], bool]
+        self.handlers = self.bind_handlers()
 
     def tick(self) -> None:
         operation = self.fetch()
-        logging.info(self)
-        logging.info(("Operation", hex(operation)[2:].zfill(4)))
-        self.pressed_buttons = self.display.pressed_buttons()
-        self.debug_info.update(
-            int(operation),
-            int(self.register_I),
-            int(self.register_DT),
-            int(self.register_PC),
-            [int(v) for v in self.data_registers],
-            [int(v) for v in self.stack],
-        )
+        if logging.getLogger().isEnabledFor(logging.INFO):
+            logging.info(self)
+            logging.info(("Operation", hex(operation)[2:].zfill(4)))
+        self.pressed_buttons = self.display.consume_buttons()
         if self.wait_for_input_reg:
             if not self.pressed_buttons:
+                self.display.idle()
                 return
             val = np.uint8(next(iter(self.pressed_buttons)))
             self.set_register(self.wait_for_input_reg, val)
@@ -62,225 +76,341 @@ class CPU:
         if self.register_DT > 0:
             self.register_DT -= np.uint8(1)
 
+    def publish_debug_info(self) -> None:
+        if self.debug_info:
+            self.debug_info.update(
+                int(self.peek()),
+                int(self.register_I),
+                int(self.register_DT),
+                int(self.register_PC),
+                [int(v) for v in self.data_registers],
+                [int(v) for v in self.stack],
+            )
+
+    def run_command(self, command: str, argument: int) -> None:
+        match command:
+            case debug.RUN_STEPS:
+                self.run_until(lambda: False, argument)
+            case debug.RUN_FRAME:
+                self.run_until(lambda: False, TICKS_PER_FRAME)
+            case debug.RUN_UNTIL_PC:
+                # if PC is already at the address this continues until it gets there again, e.g. the next loop iteration
+                self.run_until(lambda: self.register_PC == argument)
+            case debug.RUN_UNTIL_DRAW:
+                self.run_until_draw()
+            case debug.RUN_UNTIL_RETURN:
+                depth = len(self.stack)
+                # outside of a subroutine there is nothing to return from
+                if depth:
+                    self.run_until(lambda: len(self.stack) < depth)
+            case _:
+                raise NotImplementedError(command)
+
+    def run_until(self, stop: Callable[[], bool], max_ticks: int = MAX_RUN_TICKS) -> None:
+        tick = self.tick
+        for _ in range(max_ticks):
+            tick()
+            if stop():
+                return
+
+    def run_until_draw(self, max_ticks: int = MAX_RUN_TICKS) -> None:
+        for _ in range(max_ticks):
+            kind = KIND_TABLE[int(self.peek())]
+            waiting = self.wait_for_input_reg
+            self.tick()
+            if kind in DRAW_KINDS and not waiting:
+                return
+
     def fetch(self) -> np.uint16:
         return self.memory.read_op(self.register_PC)
 
-    def execute(self, operation: np.uint16) -> None:  # noqa: C901, PLR0912, PLR0915
-        hex_repr = hex(int(operation))[2:].zfill(4)
-        match tuple(hex_repr):
-            case ("0", "0", "e", "0"):
-                # 00E0 - CLS                                - Clear the display.
-                self.display.clear()
-                self.register_PC += np.uint16(2)
-            case ("0", "0", "e", "e"):
-                # 00EE - RET                                - Return from a subroutine.
-                self.register_PC = self.stack.pop()
-                self.register_PC += np.uint16(2)
-            case ("0", *_):
-                # 0nnn - SYS addr                           - Jump to a machine code routine at nnn.
-                logging.warning("Ignore old instruction 0nnn")
-                self.register_PC += np.uint16(2)
-            case ("1", *_):
-                # 1nnn - JP addr                            - Jump to location nnn.
-                self.register_PC = read_address(operation)
-            case ("2", *_):
-                # 2nnn - CALL addr                          - Call subroutine at nnn.
-                self.stack.append(self.register_PC)
-                self.register_PC = read_address(operation)
-            case ("3", vx, *_):
-                # 3xkk - SE Vx, byte                        - Skip next instruction if Vx = kk.
-                value = self.get_register(vx)
-                if value == read_byte(operation):
-                    self.register_PC += np.uint16(2)
-                self.register_PC += np.uint16(2)
-            case ("4", vx, *_):
-                # 4xkk - SNE Vx, byte                       - Skip next instruction if Vx != kk.
-                value = self.get_register(vx)
-                if value != read_byte(operation):
-                    self.register_PC += np.uint16(2)
-                self.register_PC += np.uint16(2)
-            case ("5", vx, vy, "0"):
-                # 5xy0 - SE Vx, Vy                          - Skip next instruction if Vx = Vy.
-                value_1 = self.get_register(vx)
-                value_2 = self.get_register(vy)
-                if value_1 == value_2:
-                    self.register_PC += np.uint16(2)
-                self.register_PC += np.uint16(2)
-            case ("6", vx, *_):
-                # 6xkk - LD Vx, byte                        - Set Vx = kk.
-                self.set_register(vx, read_byte(operation))
-                self.register_PC += np.uint16(2)
-            case ("7", vx, *_):
-                # 7xkk - ADD Vx, byte                       - Set Vx = Vx + kk.
-                value = self.get_register(vx)
-                value += read_byte(operation)
-                self.set_register(vx, value)
-                self.register_PC += np.uint16(2)
-            case ("8", vx, vy, "0"):
-                # 8xy2 - AND Vx, Vy                         - Set Vx = Vx AND Vy.
-                value_2 = self.get_register(vy)
-                self.set_register(vx, value_2)
-                self.register_PC += np.uint16(2)
-            case ("8", vx, vy, "1"):
-                # 8xy2 - OR Vx, Vy                         - Set Vx = Vx OR Vy.
-                value_1 = self.get_register(vx)
-                value_2 = self.get_register(vy)
-                value = value_1 | value_2
-                self.set_register(vx, value)
-                self.register_PC += np.uint16(2)
-            case ("8", vx, vy, "2"):
-                # 8xy2 - AND Vx, Vy                         - Set Vx = Vx AND Vy.
-                value_1 = self.get_register(vx)
-                value_2 = self.get_register(vy)
-                value = value_1 & value_2
-                self.set_register(vx, value)
-                self.register_PC += np.uint16(2)
-            case ("8", vx, vy, "3"):
-                # 8xy3 - XOR Vx, Vy                       - Set Vx = Vx XOR Vy.
-                value_1 = self.get_register(vx)
-                value_2 = self.get_register(vy)
-                value = value_1 ^ value_2
-                self.set_register(vx, value)
-                self.register_PC += np.uint16(2)
-            case ("8", vx, vy, "4"):
-                # 8xy4 - ADD Vx, Vy                         - Set Vx = Vx + Vy, set VF = carry.
-                value_1 = self.get_register(vx)
-                value_2 = self.get_register(vy)
-                value = value_1 + value_2
-                if int(value_1) + int(value_2) >= 2**8:
-                    self.set_register("f", np.uint8(1))
-                else:
-                    self.set_register("f", np.uint8(0))
-                self.set_register(vx, value)
-                self.register_PC += np.uint16(2)
-            case ("8", vx, vy, "5"):
-                # 8xy5 - SUB Vx, Vy                         - Set Vx = Vx - Vy, set VF = NOT borrow.
-                value_1 = self.get_register(vx)
-                value_2 = self.get_register(vy)
-                value = value_1 - value_2
-                if int(value_1) > int(value_2):
-                    self.set_register("f", np.uint8(1))
-                else:
-                    self.set_register("f", np.uint8(0))
-                self.set_register(vx, value)
-                self.register_PC += np.uint16(2)
-            case ("8", vx, _, "6"):
-                # 8xy6 - SHR Vx {, Vy}                      - Set Vx = Vx SHR 1.
-                value = self.get_register(vx)
-                if value & 1:
-                    self.set_register("f", np.uint8(1))
-                else:
-                    self.set_register("f", np.uint8(0))
-                value //= 2
-                self.set_register(vx, value)
-                self.register_PC += np.uint16(2)
-            case ("8", vx, vy, "7"):
-                # 8xy7 - SUBN Vx, Vy                        - Set Vx = Vy - Vx, set VF = NOT borrow.
-                value_1 = self.get_register(vx)
-                value_2 = self.get_register(vy)
-                value = value_2 - value_1
-                if int(value_2) > int(value_1):
-                    self.set_register("f", np.uint8(1))
-                else:
-                    self.set_register("f", np.uint8(0))
-                self.set_register(vx, value)
-                self.register_PC += np.uint16(2)
-            case ("8", vx, _, "e"):
-                # 8xyE - SHL Vx {, Vy}                      - Set Vx = Vx SHL 1.
-                value = self.get_register(vx)
-                if value & 2**7:
-                    self.set_register("f", np.uint8(1))
-                else:
-                    self.set_register("f", np.uint8(0))
-                value *= 2
-                self.set_register(vx, value)
-                self.register_PC += np.uint16(2)
-            case ("9", vx, vy, "0"):
-                # 9xy0 - SNE Vx, Vy                         - Skip next instruction if Vx != Vy.
-                value_1 = self.get_register(vx)
-                value_2 = self.get_register(vy)
-                if value_1 != value_2:
-                    self.register_PC += np.uint16(2)
-                self.register_PC += np.uint16(2)
-            case ("a", *_):
-                # Annn - LD I, addr                         - Set I = nnn
-                self.register_I = read_address(operation)
-                self.register_PC += np.uint16(2)
-            case ("c", vx, *_):
-                # Cxkk - RND Vx, byte                       - Set Vx = random byte AND kk.
-                rnd = np.uint8(random.randint(0, 255))  # noqa: S311
-                value = rnd & read_byte(operation)
-                self.set_register(vx, value)
-                self.register_PC += np.uint16(2)
-            case ("d", vx, vy, _):
-                # Dxyn - DRW Vx, Vy, nibble                 - Display n-byte sprite starting at memory location I at (Vx, Vy), set VF = collision  # noqa: E501
-                coord_x = self.get_register(vx)
-                coord_y = self.get_register(vy)
-                graphic_data = self.memory.read_bytes(self.register_I, read_half_byte(operation))
-                erased = self.display.blit(coord_x, coord_y, graphic_data)
-                self.set_register("f", np.uint8(1 if erased else 0))
-                self.register_PC += np.uint16(2)
-            case ("e", vx, "9", "e"):
-                # Ex9E - SKP Vx                             - Skip next instruction if key with the value of Vx is pressed.  # noqa: E501
-                value = self.get_register(vx)
-                if self.is_pressed(value):
-                    self.register_PC += np.uint16(2)
-                self.register_PC += np.uint16(2)
-            case ("e", vx, "a", "1"):
-                # ExA1 - SKNP Vx                            - Skip next instruction if key with the value of Vx is not pressed.  # noqa: E501
-                value = self.get_register(vx)
-                if not self.is_pressed(value):
-                    self.register_PC += np.uint16(2)
-                self.register_PC += np.uint16(2)
-            case ("f", vx, "0", "7"):
-                # Fx07 - LD Vx, DT                          - Set Vx = delay timer value.
-                value = self.register_DT
-                self.set_register(vx, value)
-                self.register_PC += np.uint16(2)
-            case ("f", vx, "0", "a"):
-                # Fx0A - LD Vx, K                           - Wait for a key press, store the value of the key in Vx.
-                self.wait_for_input_reg = vx
-            case ("f", vx, "1", "5"):
-                # Fx15 - LD DT, Vx                          - Set delay timer = Vx.
-                self.register_DT = self.get_register(vx)
-                self.register_PC += np.uint16(2)
-            case ("f", vx, "1", "8"):
-                # Fx18 - LD ST, Vx                          - Set sound timer = Vx.
-                # TODO: implement sound correctly
-                value = self.get_register(vx)
-                self.sound.play(int(value))
-                self.register_PC += np.uint16(2)
-            case ("f", vx, "1", "e"):
-                # Fx1E - ADD I, Vx                          - Set I = I + Vx.
-                self.register_I += self.get_register(vx)
-                self.register_PC += np.uint16(2)
-            case ("f", vx, "2", "9"):
-                # Fx29 - LD F, Vx                           - Set I = location of sprite for digit Vx.
-                sprite_num = self.get_register(vx)
-                self.register_I = np.uint16(sprite_num * 5)
-                self.register_PC += np.uint16(2)
-            case ("f", vx, "3", "3"):
-                # Fx33 - LD B, Vx                           - Store BCD representation of Vx in memory locations I, I+1, and I+2.  # noqa: E501
-                value = int(self.get_register(vx))
-                self.memory.set_byte(self.register_I + np.uint16(2), np.uint8(value % 10))
-                value //= 10
-                self.memory.set_byte(self.register_I + np.uint16(1), np.uint8(value % 10))
-                value //= 10
-                self.memory.set_byte(self.register_I + np.uint16(0), np.uint8(value % 10))
-                self.register_PC += np.uint16(2)
-            case ("f", vx, "5", "5"):
-                # Fx55 - LD [I], Vx                         - Store registers V0 through Vx in memory starting at location I.  # noqa: E501
-                for i in range(int(vx, 16) + 1):
-                    self.memory.set_byte(self.register_I + np.uint16(i), self.get_register(hex(i)))
-                self.register_PC += np.uint16(2)
-            case ("f", vx, "6", "5"):
-                # Fx65 - LD Vx, [I]                         - Read registers V0 through Vx from memory starting at location I.  # noqa: E501
-                for i in range(int(vx, 16) + 1):
-                    read_bytes = self.memory.read_bytes(self.register_I + np.uint16(i), np.uint8(1))
-                    self.set_register(hex(i), read_bytes[0])
-                self.register_PC += np.uint16(2)
-            case _:
-                raise NotImplementedError(hex_repr)
+    def peek(self) -> np.uint16:
+        return self.memory.peek_op(self.register_PC)
+
+    def execute(self, operation: np.uint16) -> None:
+        op = int(operation)
+        self.handlers[KIND_TABLE[op]](op)
+
+    def bind_handlers(self) -> list[Handler]:
+        # the quirks are resolved once here, the handlers themselves never check them
+        quirks = self.quirks
+        self.draw = self.display.blit_clipped if quirks.clip_sprites else self.display.blit
+        handlers: dict[str, Handler] = {
+            "0nnn": self.op_sys,
+            "00E0": self.op_cls,
+            "00EE": self.op_ret,
+            "1nnn": self.op_jp,
+            "2nnn": self.op_call,
+            "3xkk": self.op_se_byte,
+            "4xkk": self.op_sne_byte,
+            "5xy0": self.op_se_register,
+            "6xkk": self.op_ld_byte,
+            "7xkk": self.op_add_byte,
+            "8xy0": self.op_ld_register,
+            "8xy1": self.op_or,
+            "8xy2": self.op_and,
+            "8xy3": self.op_xor,
+            "8xy4": self.op_add_register,
+            "8xy5": self.op_sub,
+            "8xy6": self.op_shr_vy if quirks.shift_uses_vy else self.op_shr,
+            "8xy7": self.op_subn,
+            "8xyE": self.op_shl_vy if quirks.shift_uses_vy else self.op_shl,
+            "9xy0": self.op_sne_register,
+            "Annn": self.op_ld_i,
+            "Bnnn": self.op_jp_vx if quirks.jump_uses_vx else self.op_jp_v0,
+            "Cxkk": self.op_rnd,
+            "Dxyn": self.op_drw,
+            "Ex9E": self.op_skp,
+            "ExA1": self.op_sknp,
+            "Fx07": self.op_ld_from_dt,
+            "Fx0A": self.op_ld_key,
+            "Fx15": self.op_ld_dt,
+            "Fx18": self.op_ld_st,
+            "Fx1E": self.op_add_i,
+            "Fx29": self.op_ld_font,
+            "Fx33": self.op_ld_bcd,
+            "Fx55": self.with_index_increment(self.op_store_registers),
+            "Fx65": self.with_index_increment(self.op_load_registers),
+        }
+        table: list[Handler] = [self.op_unknown] * 256
+        for kind, inst in enumerate(INSTRUCTIONS):
+            table[kind] = handlers[inst]
+        return table
+
+    def with_index_increment(self, handler: Handler) -> Handler:
+        if self.quirks.index_increment == IndexIncrement.NONE:
+            return handler
+        offset = 1 if self.quirks.index_increment == IndexIncrement.X_PLUS_ONE else 0
+
+        def increment_index(op: int) -> None:
+            handler(op)
+            self.register_I = np.uint16((int(self.register_I) + (op >> 8 & 0xF) + offset) & 0xFFFF)
+
+        return increment_index
+
+    def op_unknown(self, op: int) -> None:
+        raise NotImplementedError(hex(op)[2:].zfill(4))
+
+    def op_sys(self, op: int) -> None:  # noqa: ARG002
+        # 0nnn - SYS addr                           - Jump to a machine code routine at nnn.
+        logging.warning("Ignore old instruction 0nnn")
+        self.register_PC += np.uint16(2)
+
+    def op_cls(self, op: int) -> None:  # noqa: ARG002
+        # 00E0 - CLS                                - Clear the display.
+        self.display.clear()
+        self.register_PC += np.uint16(2)
+
+    def op_ret(self, op: int) -> None:  # noqa: ARG002
+        # 00EE - RET                                - Return from a subroutine.
+        self.register_PC = self.stack.pop()
+        self.register_PC += np.uint16(2)
+
+    def op_jp(self, op: int) -> None:
+        # 1nnn - JP addr                            - Jump to location nnn.
+        self.register_PC = np.uint16(op & 0x0FFF)
+
+    def op_call(self, op: int) -> None:
+        # 2nnn - CALL addr                          - Call subroutine at nnn.
+        self.stack.append(self.register_PC)
+        self.register_PC = np.uint16(op & 0x0FFF)
+
+    def op_se_byte(self, op: int) -> None:
+        # 3xkk - SE Vx, byte                        - Skip next instruction if Vx = kk.
+        if self.data_registers[op >> 8 & 0xF] == op & 0xFF:
+            self.register_PC += np.uint16(2)
+        self.register_PC += np.uint16(2)
+
+    def op_sne_byte(self, op: int) -> None:
+        # 4xkk - SNE Vx, byte                       - Skip next instruction if Vx != kk.
+        if self.data_registers[op >> 8 & 0xF] != op & 0xFF:
+            self.register_PC += np.uint16(2)
+        self.register_PC += np.uint16(2)
+
+    def op_se_register(self, op: int) -> None:
+        # 5xy0 - SE Vx, Vy                          - Skip next instruction if Vx = Vy.
+        if self.data_registers[op >> 8 & 0xF] == self.data_registers[op >> 4 & 0xF]:
+            self.register_PC += np.uint16(2)
+        self.register_PC += np.uint16(2)
+
+    def op_ld_byte(self, op: int) -> None:
+        # 6xkk - LD Vx, byte                        - Set Vx = kk.
+        self.data_registers[op >> 8 & 0xF] = op & 0xFF
+        self.register_PC += np.uint16(2)
+
+    def op_add_byte(self, op: int) -> None:
+        # 7xkk - ADD Vx, byte                       - Set Vx = Vx + kk.
+        vx = op >> 8 & 0xF
+        self.data_registers[vx] = (int(self.data_registers[vx]) + op) & 0xFF
+        self.register_PC += np.uint16(2)
+
+    def op_ld_register(self, op: int) -> None:
+        # 8xy0 - LD Vx, Vy                          - Set Vx = Vy.
+        self.data_registers[op >> 8 & 0xF] = self.data_registers[op >> 4 & 0xF]
+        self.register_PC += np.uint16(2)
+
+    def op_or(self, op: int) -> None:
+        # 8xy1 - OR Vx, Vy                          - Set Vx = Vx OR Vy.
+        self.data_registers[op >> 8 & 0xF] |= self.data_registers[op >> 4 & 0xF]
+        self.register_PC += np.uint16(2)
+
+    def op_and(self, op: int) -> None:
+        # 8xy2 - AND Vx, Vy                         - Set Vx = Vx AND Vy.
+        self.data_registers[op >> 8 & 0xF] &= self.data_registers[op >> 4 & 0xF]
+        self.register_PC += np.uint16(2)
+
+    def op_xor(self, op: int) -> None:
+        # 8xy3 - XOR Vx, Vy                         - Set Vx = Vx XOR Vy.
+        self.data_registers[op >> 8 & 0xF] ^= self.data_registers[op >> 4 & 0xF]
+        self.register_PC += np.uint16(2)
+
+    def op_add_register(self, op: int) -> None:
+        # 8xy4 - ADD Vx, Vy                         - Set Vx = Vx + Vy, set VF = carry.
+        value = int(self.data_registers[op >> 8 & 0xF]) + int(self.data_registers[op >> 4 & 0xF])
+        self.data_registers[0xF] = value >> 8
+        self.data_registers[op >> 8 & 0xF] = value & 0xFF
+        self.register_PC += np.uint16(2)
+
+    def op_sub(self, op: int) -> None:
+        # 8xy5 - SUB Vx, Vy                         - Set Vx = Vx - Vy, set VF = NOT borrow.
+        value_1 = int(self.data_registers[op >> 8 & 0xF])
+        value_2 = int(self.data_registers[op >> 4 & 0xF])
+        self.data_registers[0xF] = value_1 > value_2
+        self.data_registers[op >> 8 & 0xF] = (value_1 - value_2) & 0xFF
+        self.register_PC += np.uint16(2)
+
+    def op_shr(self, op: int) -> None:
+        # 8xy6 - SHR Vx {, Vy}                      - Set Vx = Vx SHR 1.
+        value = int(self.data_registers[op >> 8 & 0xF])
+        self.data_registers[0xF] = value & 1
+        self.data_registers[op >> 8 & 0xF] = value >> 1
+        self.register_PC += np.uint16(2)
+
+    def op_shr_vy(self, op: int) -> None:
+        # 8xy6 - SHR Vx, Vy                         - Set Vx = Vy SHR 1.
+        value = int(self.data_registers[op >> 4 & 0xF])
+        self.data_registers[0xF] = value & 1
+        self.data_registers[op >> 8 & 0xF] = value >> 1
+        self.register_PC += np.uint16(2)
+
+    def op_subn(self, op: int) -> None:
+        # 8xy7 - SUBN Vx, Vy                        - Set Vx = Vy - Vx, set VF = NOT borrow.
+        value_1 = int(self.data_registers[op >> 8 & 0xF])
+        value_2 = int(self.data_registers[op >> 4 & 0xF])
+        self.data_registers[0xF] = value_2 > value_1
+        self.data_registers[op >> 8 & 0xF] = (value_2 - value_1) & 0xFF
+        self.register_PC += np.uint16(2)
+
+    def op_shl(self, op: int) -> None:
+        # 8xyE - SHL Vx {, Vy}                      - Set Vx = Vx SHL 1.
+        value = int(self.data_registers[op >> 8 & 0xF])
+        self.data_registers[0xF] = value >> 7
+        self.data_registers[op >> 8 & 0xF] = (value << 1) & 0xFF
+        self.register_PC += np.uint16(2)
+
+    def op_shl_vy(self, op: int) -> None:
+        # 8xyE - SHL Vx, Vy                         - Set Vx = Vy SHL 1.
+        value = int(self.data_registers[op >> 4 & 0xF])
+        self.data_registers[0xF] = value >> 7
+        self.data_registers[op >> 8 & 0xF] = (value << 1) & 0xFF
+        self.register_PC += np.uint16(2)
+
+    def op_sne_register(self, op: int) -> None:
+        # 9xy0 - SNE Vx, Vy                         - Skip next instruction if Vx != Vy.
+        if self.data_registers[op >> 8 & 0xF] != self.data_registers[op >> 4 & 0xF]:
+            self.register_PC += np.uint16(2)
+        self.register_PC += np.uint16(2)
+
+    def op_ld_i(self, op: int) -> None:
+        # Annn - LD I, addr                         - Set I = nnn
+        self.register_I = np.uint16(op & 0x0FFF)
+        self.register_PC += np.uint16(2)
+
+    def op_jp_v0(self, op: int) -> None:
+        # Bnnn - JP V0, addr                        - Jump to location nnn + V0.
+        self.register_PC = np.uint16((op & 0x0FFF) + int(self.data_registers[0]))
+
+    def op_jp_vx(self, op: int) -> None:
+        # Bxnn - JP Vx, addr                        - Jump to location xnn + Vx.
+        self.register_PC = np.uint16((op & 0x0FFF) + int(self.data_registers[op >> 8 & 0xF]))
+
+    def op_rnd(self, op: int) -> None:
+        # Cxkk - RND Vx, byte                       - Set Vx = random byte AND kk.
+        self.data_registers[op >> 8 & 0xF] = self.rng.randint(0, 255) & op
+        self.register_PC += np.uint16(2)
+
+    def op_drw(self, op: int) -> None:
+        # Dxyn - DRW Vx, Vy, nibble                 - Display n-byte sprite starting at memory location I at (Vx, Vy), set VF = collision  # noqa: E501
+        coord_x = self.data_registers[op >> 8 & 0xF]
+        coord_y = self.data_registers[op >> 4 & 0xF]
+        graphic_data = self.memory.read_bytes(self.register_I, np.uint8(op & 0xF))
+        self.data_registers[0xF] = self.draw(coord_x, coord_y, graphic_data)
+        self.register_PC += np.uint16(2)
+
+    def op_skp(self, op: int) -> None:
+        # Ex9E - SKP Vx                             - Skip next instruction if key with the value of Vx is pressed.
+        if self.is_pressed(self.data_registers[op >> 8 & 0xF]):
+            self.register_PC += np.uint16(2)
+        self.register_PC += np.uint16(2)
+
+    def op_sknp(self, op: int) -> None:
+        # ExA1 - SKNP Vx                            - Skip next instruction if key with the value of Vx is not pressed.
+        if not self.is_pressed(self.data_registers[op >> 8 & 0xF]):
+            self.register_PC += np.uint16(2)
+        self.register_PC += np.uint16(2)
+
+    def op_ld_from_dt(self, op: int) -> None:
+        # Fx07 - LD Vx, DT                          - Set Vx = delay timer value.
+        self.data_registers[op >> 8 & 0xF] = self.register_DT
+        self.register_PC += np.uint16(2)
+
+    def op_ld_key(self, op: int) -> None:
+        # Fx0A - LD Vx, K                           - Wait for a key press, store the value of the key in Vx.
+        self.wait_for_input_reg = hex(op >> 8 & 0xF)[2:]
+
+    def op_ld_dt(self, op: int) -> None:
+        # Fx15 - LD DT, Vx                          - Set delay timer = Vx.
+        self.register_DT = self.data_registers[op >> 8 & 0xF]
+        self.register_PC += np.uint16(2)
+
+    def op_ld_st(self, op: int) -> None:
+        # Fx18 - LD ST, Vx                          - Set sound timer = Vx.
+        # TODO: implement sound correctly
+        self.sound.play(int(self.data_registers[op >> 8 & 0xF]))
+        self.register_PC += np.uint16(2)
+
+    def op_add_i(self, op: int) -> None:
+        # Fx1E - ADD I, Vx                          - Set I = I + Vx.
+        self.register_I = np.uint16((int(self.register_I) + int(self.data_registers[op >> 8 & 0xF])) & 0xFFFF)
+        self.register_PC += np.uint16(2)
+
+    def op_ld_font(self, op: int) -> None:
+        # Fx29 - LD F, Vx                           - Set I = location of sprite for digit Vx.
+        self.register_I = np.uint16(int(self.data_registers[op >> 8 & 0xF]) * 5)
+        self.register_PC += np.uint16(2)
+
+    def op_ld_bcd(self, op: int) -> None:
+        # Fx33 - LD B, Vx                           - Store BCD representation of Vx in memory locations I, I+1, and I+2.  # noqa: E501
+        value = int(self.data_registers[op >> 8 & 0xF])
+        self.memory.set_byte(self.register_I + np.uint16(2), np.uint8(value % 10))
+        value //= 10
+        self.memory.set_byte(self.register_I + np.uint16(1), np.uint8(value % 10))
+        value //= 10
+        self.memory.set_byte(self.register_I + np.uint16(0), np.uint8(value % 10))
+        self.register_PC += np.uint16(2)
+
+    def op_store_registers(self, op: int) -> None:
+        # Fx55 - LD [I], Vx                         - Store registers V0 through Vx in memory starting at location I.
+        for i in range((op >> 8 & 0xF) + 1):
+            self.memory.set_byte(self.register_I + np.uint16(i), self.data_registers[i])
+        self.register_PC += np.uint16(2)
+
+    def op_load_registers(self, op: int) -> None:
+        # Fx65 - LD Vx, [I]                         - Read registers V0 through Vx from memory starting at location I.
+        for i in range((op >> 8 & 0xF) + 1):
+            read_bytes = self.memory.read_bytes(self.register_I + np.uint16(i), np.uint8(1))
+            self.data_registers[i] = read_bytes[0]
+        self.register_PC += np.uint16(2)
 
     def is_pressed(self, key_num: np.uint8) -> bool:
         return bool(key_num in self.pressed_buttons)
@@ -24,5 +24,4 @@ FONT_DATA = [
 
 
 def read_rom(rom_file: Path) -> npt.NDArray[np.uint8]:
-    rom_bytes = bytearray(rom_file.read_bytes())
-    return np.asarray(rom_bytes, dtype=np.uint8)
+    return np.fromfile(rom_file, dtype=np.uint8)
@@ -1,43 +1,7 @@
 from multiprocessing import Queue
 from multiprocessing.managers import SyncManager
 
-INSTRUCTION_PARSING = {
-    "0nnn": "SYS addr",
-    "00E0": "CLS",
-    "00EE": "RET",
-    "1nnn": "JP addr",
-    "2nnn": "CALL addr",
-    "3xkk": "SE Vx: byte",
-    "4xkk": "SNE Vx: byte",
-    "5xy0": "SE Vx: Vy",
-    "6xkk": "LD Vx: byte",
-    "7xkk": "ADD Vx: byte",
-    "8xy0": "LD Vx: Vy",
-    "8xy1": "OR Vx: Vy",
-    "8xy2": "AND Vx: Vy",
-    "8xy3": "XOR Vx: Vy",
-    "8xy4": "ADD Vx: Vy",
-    "8xy5": "SUB Vx: Vy",
-    "8xy6": "SHR Vx {: Vy}",
-    "8xy7": "SUBN Vx: Vy",
-    "8xyE": "SHL Vx {: Vy}",
-    "9xy0": "SNE Vx: Vy",
-    "Annn": "LD I: addr",
-    "Bnnn": "JP V0: addr",
-    "Cxkk": "RND Vx: byte",
-    "Dxyn": "DRW Vx, Vy: nibble",
-    "Ex9E": "SKP Vx",
-    "ExA1": "SKNP Vx",
-    "Fx07": "LD Vx: DT",
-    "Fx0A": "LD Vx: K",
-    "Fx15": "LD DT: Vx",
-    "Fx18": "LD ST: Vx",
-    "Fx1E": "ADD I: Vx",
-    "Fx29": "LD F: Vx",
-    "Fx33": "LD B: Vx",
-    "Fx55": "LD [I]: Vx",
-    "Fx65": "LD Vx: [I]",
-}
+from .decode import disassemble
 
 
 class DebugInformation:
@@ -58,31 +22,14 @@ class DebugInformation:
         self.stack = stack
 
     def get_instruction(self) -> str:
-        inst = hex(self.instruction)[2:].zfill(4).upper()
-        fitting_inst = max(
-            INSTRUCTION_PARSING,
-            key=lambda i: sum(inst[j] == i[j] for j in range(4) if i[j] not in "xykn") if inst[0] == i[0] else -1,
-        )
-        inst_asm = INSTRUCTION_PARSING[fitting_inst]
-        if fitting_inst[1:] == "nnn":
-            inst_asm = inst_asm.replace("addr", f"0x{inst[1:].zfill(4)}")
-        elif fitting_inst[1:] == "xkk":
-            inst_asm = inst_asm.replace("x", inst[1].lower())
-            inst_asm = inst_asm.replace("byte", f"0x{inst[2:].zfill(2)}")
-        elif fitting_inst[1:] == "xyn":
-            inst_asm = inst_asm.replace("x", inst[1].lower())
-            inst_asm = inst_asm.replace("y", inst[2].lower())
-            inst_asm = inst_asm.replace("nibble", f"0x{inst[3].zfill(2)}")
-        elif fitting_inst[1:3] == "xy":
-            inst_asm = inst_asm.replace("x", inst[1].lower())
-            inst_asm = inst_asm.replace("y", inst[2].lower())
-        elif fitting_inst[1] == "x":
-            inst_asm = inst_asm.replace("x", inst[1].lower())
-        return f"0x{inst} - {inst_asm}"
+        return disassemble(self.instruction)
 
     def get_register_i(self) -> str:
         return f"0x{hex(self.register_I)[2:].zfill(4).upper()} | {self.register_I}"
 
+    def get_pc(self) -> int:
+        return self.register_PC
+
     def get_register_pc(self) -> str:
         return f"0x{hex(self.register_PC)[2:].zfill(4).upper()} | {self.register_PC}"
 
@@ -115,12 +62,21 @@ class DebugInformation:
         return debug
 
 
+# batched commands, the emulator runs them without throttling and publishes the state when they stop
+RUN_STEPS = "steps"  # run n instructions
+RUN_FRAME = "frame"  # run the instructions of one 60 Hz frame
+RUN_UNTIL_PC = "until_pc"  # run until PC reaches the given address, at least one instruction is executed
+RUN_UNTIL_DRAW = "until_draw"  # run until a Dxyn or 00E0 was executed
+RUN_UNTIL_RETURN = "until_return"  # run until the current subroutine returned
+
+
 class DebugPipe:
     def __init__(self) -> None:
-        self.queue_in: "Queue[str]" = Queue()
+        self.queue_in: "Queue[str | tuple[str, int]]" = Queue()
         self.paused = False
         self.resetted = False
         self.steps = 0
+        self.commands: list[tuple[str, int]] = []
 
     def pause(self) -> None:
         self.queue_in.put_nowait("pause")
@@ -130,6 +86,10 @@ class DebugPipe:
         self.queue_in.put_nowait("step")
         self.paused = True
 
+    def run(self, command: str, argument: int = 0) -> None:
+        self.queue_in.put_nowait((command, argument))
+        self.paused = True
+
     def continue_(self) -> None:
         self.queue_in.put_nowait("continue")
         self.paused = False
@@ -149,11 +109,20 @@ class DebugPipe:
             return True
         return False
 
+    def next_command(self) -> tuple[str, int] | None:
+        if self.commands:
+            return self.commands.pop(0)
+        return None
+
     def fetch_messages(self) -> None:
         while not self.queue_in.empty():
             msg = self.queue_in.get(block=False)
             if not msg:
                 continue
+            if isinstance(msg, tuple):
+                self.commands.append(msg)
+                self.paused = True
+                continue
             if msg == "pause":
                 self.paused = True
             if msg == "continue":
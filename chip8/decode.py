@@ -0,0 +1,161 @@
+import numpy as np
+import numpy.typing as npt
+
+from .memory import MEMORY_START_ROM
+
+# bump whenever the decoding or the analysis changes, cached analyses of older versions are ignored
+DECODER_VERSION = 1
+
+INSTRUCTION_PARSING = {
+    "0nnn": "SYS addr",
+    "00E0": "CLS",
+    "00EE": "RET",
+    "1nnn": "JP addr",
+    "2nnn": "CALL addr",
+    "3xkk": "SE Vx: byte",
+    "4xkk": "SNE Vx: byte",
+    "5xy0": "SE Vx: Vy",
+    "6xkk": "LD Vx: byte",
+    "7xkk": "ADD Vx: byte",
+    "8xy0": "LD Vx: Vy",
+    "8xy1": "OR Vx: Vy",
+    "8xy2": "AND Vx: Vy",
+    "8xy3": "XOR Vx: Vy",
+    "8xy4": "ADD Vx: Vy",
+    "8xy5": "SUB Vx: Vy",
+    "8xy6": "SHR Vx {: Vy}",
+    "8xy7": "SUBN Vx: Vy",
+    "8xyE": "SHL Vx {: Vy}",
+    "9xy0": "SNE Vx: Vy",
+    "Annn": "LD I: addr",
+    "Bnnn": "JP V0: addr",
+    "Cxkk": "RND Vx: byte",
+    "Dxyn": "DRW Vx, Vy: nibble",
+    "Ex9E": "SKP Vx",
+    "ExA1": "SKNP Vx",
+    "Fx07": "LD Vx: DT",
+    "Fx0A": "LD Vx: K",
+    "Fx15": "LD DT: Vx",
+    "Fx18": "LD ST: Vx",
+    "Fx1E": "ADD I: Vx",
+    "Fx29": "LD F: Vx",
+    "Fx33": "LD B: Vx",
+    "Fx55": "LD [I]: Vx",
+    "Fx65": "LD Vx: [I]",
+}
+
+
+INSTRUCTIONS = list(INSTRUCTION_PARSING)
+UNKNOWN = 0xFF
+
+FLAG_CODE = 1
+FLAG_BLOCK_START = 2
+
+SKIPS = {"3xkk", "4xkk", "5xy0", "9xy0", "Ex9E", "ExA1"}
+
+
+def build_kind_table() -> npt.NDArray[np.uint8]:
+    ops = np.arange(2**16, dtype=np.uint32)
+    first = ops >> 12
+    last = ops & 0xF
+    low = ops & 0xFF
+    kinds = np.full(2**16, UNKNOWN, dtype=np.uint8)
+    for kind, inst in enumerate(INSTRUCTIONS):
+        if inst[0] == "0":
+            continue
+        mask = first == int(inst[0], 16)
+        if inst[2:] in ("kk", "nn", "yn"):
+            kinds[mask] = kind
+        elif inst[2] == "y":
+            kinds[mask & (last == int(inst[3], 16))] = kind
+        else:
+            kinds[mask & (low == int(inst[2:], 16))] = kind
+    kinds[first == 0] = INSTRUCTIONS.index("0nnn")
+    kinds[0x00E0] = INSTRUCTIONS.index("00E0")
+    kinds[0x00EE] = INSTRUCTIONS.index("00EE")
+    return kinds
+
+
+# operation -> index into INSTRUCTIONS
+KIND_TABLE = build_kind_table()
+
+
+def disassemble(operation: int) -> str:
+    inst = hex(operation)[2:].zfill(4).upper()
+    kind = KIND_TABLE[operation]
+    if kind == UNKNOWN:
+        return f"0x{inst} - ???"
+    fitting_inst = INSTRUCTIONS[kind]
+    inst_asm = INSTRUCTION_PARSING[fitting_inst]
+    if fitting_inst[1:] == "nnn":
+        inst_asm = inst_asm.replace("addr", f"0x{inst[1:].zfill(4)}")
+    elif fitting_inst[1:] == "xkk":
+        inst_asm = inst_asm.replace("x", inst[1].lower())
+        inst_asm = inst_asm.replace("byte", f"0x{inst[2:].zfill(2)}")
+    elif fitting_inst[1:] == "xyn":
+        inst_asm = inst_asm.replace("x", inst[1].lower())
+        inst_asm = inst_asm.replace("y", inst[2].lower())
+        inst_asm = inst_asm.replace("nibble", f"0x{inst[3].zfill(2)}")
+    elif fitting_inst[1:3] == "xy":
+        inst_asm = inst_asm.replace("x", inst[1].lower())
+        inst_asm = inst_asm.replace("y", inst[2].lower())
+    elif fitting_inst[1] == "x":
+        inst_asm = inst_asm.replace("x", inst[1].lower())
+    return f"0x{inst} - {inst_asm}"
+
+
+CODE_DTYPE = np.dtype([("op", np.uint16), ("kind", np.uint8), ("flags", np.uint8)])
+
+
+class CodeAnalysis:
+    def __init__(self, code: npt.NDArray[np.void], disassembly: list[str]) -> None:
+        # one entry for every byte of the rom: the operation starting there, its kind and FLAG_* bits
+        self.code = code
+        self.disassembly = disassembly
+
+    def instruction_addresses(self) -> npt.NDArray[np.intp]:
+        return np.flatnonzero(self.code["flags"] & FLAG_CODE) + MEMORY_START_ROM
+
+    def block_starts(self) -> npt.NDArray[np.intp]:
+        return np.flatnonzero(self.code["flags"] & FLAG_BLOCK_START) + MEMORY_START_ROM
+
+
+def analyze(rom_data: npt.NDArray[np.uint8]) -> CodeAnalysis:
+    code = np.zeros(len(rom_data), dtype=CODE_DTYPE)
+    padded = np.append(rom_data, np.uint8(0)).astype(np.uint16)
+    code["op"] = padded[:-1] << 8 | padded[1:]
+    code["kind"] = KIND_TABLE[code["op"]]
+
+    # follow the control flow from the entry point to separate code from data
+    flags = code["flags"]
+    flags[0:1] = FLAG_BLOCK_START
+    todo = [0]
+    while todo:
+        offset = todo.pop()
+        if not 0 <= offset < len(code) - 1 or flags[offset] & FLAG_CODE:
+            continue
+        flags[offset] |= FLAG_CODE
+        kind = code["kind"][offset]
+        inst = INSTRUCTIONS[kind] if kind != UNKNOWN else "????"
+        if inst in ("1nnn", "2nnn"):
+            target = (int(code["op"][offset]) & 0x0FFF) - MEMORY_START_ROM
+            todo.append(target)
+            branches = [target]
+        else:
+            branches = []
+        if inst in SKIPS:
+            branches += [offset + 2, offset + 4]
+        elif inst == "2nnn":
+            branches.append(offset + 2)
+        for branch in branches:
+            if 0 <= branch < len(code):
+                flags[branch] |= FLAG_BLOCK_START
+        if inst in SKIPS:
+            todo.append(offset + 4)
+        if inst not in ("????", "00EE", "1nnn", "Bnnn"):
+            todo.append(offset + 2)
+    disassembly = [
+        f"0x{hex(address)[2:].zfill(4).upper()}: {disassemble(int(code['op'][address - MEMORY_START_ROM]))}"
+        for address in np.flatnonzero(code["flags"] & FLAG_CODE) + MEMORY_START_ROM
+    ]
+    return CodeAnalysis(code, disassembly)
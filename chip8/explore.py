@@ -0,0 +1,232 @@
+import argparse
+import hashlib
+import json
+import logging
+import random
+from multiprocessing import Pool
+from multiprocessing.sharedctypes import RawArray
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import numpy.typing as npt
+
+from .cache import DEFAULT_CACHE_DIR, RomCache, rom_hash
+from .constants import TICKS_PER_FRAME
+from .data import read_rom
+from .machine import Machine, MachineState
+from .quirks import QUIRK_PROFILES
+
+if TYPE_CHECKING:
+    from ctypes import Array
+
+# a step of an input script: hold the keys of the mask for some frames, optionally reseed the rng first
+Step = tuple[int, int, int | None]
+
+MAX_STEPS = 4
+MAX_FRAMES = 10
+RESEED_CHANCE = 0.2
+CORPUS_SAMPLE = 64
+
+# bitmap of reached addresses, shared by all worker processes
+coverage: npt.NDArray[np.uint8] = np.zeros(4096, dtype=np.uint8)
+
+
+class CorpusEntry:
+    def __init__(self, state: MachineState, script: list[Step]) -> None:
+        self.state = state
+        self.script = script
+
+
+class Crash:
+    def __init__(self, script: list[Step], error: Exception, pc: int) -> None:
+        self.script = script
+        self.error = f"{type(error).__name__}: {error}"
+        self.pc = pc
+
+    def to_json(self) -> dict[str, Any]:
+        return {"error": self.error, "pc": hex(self.pc), "script": self.script}
+
+
+class WorkerTask:
+    def __init__(  # noqa: PLR0913
+        self,
+        rom_data: npt.NDArray[np.uint8],
+        quirks: str,
+        corpus: list[CorpusEntry],
+        known_frames: set[bytes],
+        seed: int,
+        iterations: int,
+    ) -> None:
+        self.rom_data = rom_data
+        self.quirks = quirks
+        self.corpus = corpus
+        self.known_frames = known_frames
+        self.seed = seed
+        self.iterations = iterations
+
+
+class WorkerResult:
+    def __init__(self) -> None:
+        self.corpus: list[CorpusEntry] = []
+        self.frames: set[bytes] = set()
+        self.crashes: list[Crash] = []
+
+
+def init_worker(shared_coverage: "Array[Any]") -> None:
+    global coverage  # noqa: PLW0603
+    coverage = np.frombuffer(memoryview(shared_coverage), dtype=np.uint8)
+    logging.disable(logging.WARNING)
+
+
+def run_step(machine: Machine, step: Step, seen_frames: set[bytes]) -> bool:
+    mask, frames, seed = step
+    if seed is not None:
+        machine.seed(seed)
+    machine.set_keys(mask)
+    cpu = machine.cpu
+    new_coverage = False
+    for _ in range(frames):
+        for _ in range(TICKS_PER_FRAME):
+            pc = int(cpu.register_PC) % len(coverage)
+            if not coverage[pc]:
+                coverage[pc] = 1
+                new_coverage = True
+            cpu.tick()
+        frame = hashlib.blake2b(machine.framebuffer.tobytes(), digest_size=8).digest()
+        if frame not in seen_frames:
+            seen_frames.add(frame)
+            new_coverage = True
+    return new_coverage
+
+
+def random_step(rng: random.Random) -> Step:
+    mask = rng.choice([0, 1 << rng.randrange(16), rng.getrandbits(16)])
+    seed = rng.getrandbits(32) if rng.random() < RESEED_CHANCE else None
+    return (mask, rng.randint(1, MAX_FRAMES), seed)
+
+
+def run_worker(task: WorkerTask) -> WorkerResult:
+    machine = Machine(quirks=QUIRK_PROFILES[task.quirks])
+    machine.load(task.rom_data)
+    rng = random.Random(task.seed)  # noqa: S311
+    seen_frames = set(task.known_frames)
+    result = WorkerResult()
+    for _ in range(task.iterations):
+        parent = rng.choice(task.corpus)
+        machine.restore(parent.state)
+        script = list(parent.script)
+        new_coverage = False
+        for _ in range(rng.randint(1, MAX_STEPS)):
+            step = random_step(rng)
+            script.append(step)
+            try:
+                new_coverage |= run_step(machine, step, seen_frames)
+            except Exception as error:  # noqa: BLE001
+                result.crashes.append(Crash(script, error, int(machine.cpu.register_PC)))
+                break
+        else:
+            if new_coverage:
+                result.corpus.append(CorpusEntry(machine.snapshot(), script))
+    result.frames = seen_frames - task.known_frames
+    return result
+
+
+def replay(rom_data: npt.NDArray[np.uint8], script: list[Step], quirks: str = "default") -> Machine:
+    machine = Machine(quirks=QUIRK_PROFILES[quirks])
+    machine.load(rom_data)
+    for step in script:
+        run_step(machine, step, set())
+    return machine
+
+
+class Explorer:
+    def __init__(
+        self,
+        rom_data: npt.NDArray[np.uint8],
+        quirks: str = "default",
+        seed: int = 0,
+        cache: RomCache | None = None,
+    ) -> None:
+        self.rom_data = rom_data
+        self.quirks = quirks
+        self.rng = random.Random(seed)  # noqa: S311
+        self.coverage = RawArray("B", 4096)
+        self.machine = machine = Machine(cache, QUIRK_PROFILES[quirks])
+        machine.load(rom_data)
+        machine.seed(seed)
+        self.corpus = [CorpusEntry(machine.snapshot(), [(0, 0, seed)])]
+        self.frames: set[bytes] = set()
+        self.crashes: dict[tuple[str, int], Crash] = {}
+
+    def run(self, workers: int, rounds: int, iterations: int) -> None:
+        with Pool(workers, initializer=init_worker, initargs=[self.coverage]) as pool:
+            for _ in range(rounds):
+                tasks = [
+                    WorkerTask(
+                        self.rom_data,
+                        self.quirks,
+                        self.rng.sample(self.corpus, min(len(self.corpus), CORPUS_SAMPLE)),
+                        self.frames,
+                        self.rng.getrandbits(32),
+                        iterations,
+                    )
+                    for _ in range(workers)
+                ]
+                for result in pool.map(run_worker, tasks):
+                    self.corpus += result.corpus
+                    self.frames |= result.frames
+                    for crash in result.crashes:
+                        # keep the shortest script for every kind of crash
+                        key = (crash.error, crash.pc)
+                        if key not in self.crashes or len(crash.script) < len(self.crashes[key].script):
+                            self.crashes[key] = crash
+
+    def reached_addresses(self) -> list[int]:
+        reached: list[int] = np.flatnonzero(np.frombuffer(memoryview(self.coverage), dtype=np.uint8)).tolist()
+        return reached
+
+    def write_report(self, directory: Path) -> None:
+        reached = self.reached_addresses()
+        static_code = self.machine.analysis.instruction_addresses().tolist()
+        report = {
+            "rom_sha256": rom_hash(self.rom_data),
+            "quirks": self.quirks,
+            "reached": len(reached),
+            "static_instructions": len(static_code),
+            "unreached_static_instructions": [hex(a) for a in sorted(set(static_code) - set(reached))],
+            "reached_addresses": [hex(a) for a in reached],
+            "distinct_frames": len(self.frames),
+            "corpus": len(self.corpus),
+            "crashes": [crash.to_json() for crash in self.crashes.values()],
+        }
+        directory.mkdir(parents=True, exist_ok=True)
+        (directory / "coverage.json").write_text(json.dumps(report, indent=2))
+        for i, crash in enumerate(self.crashes.values()):
+            script = {"rom_sha256": rom_hash(self.rom_data), "quirks": self.quirks} | crash.to_json()
+            (directory / f"crash_{i:03d}.json").write_text(json.dumps(script, indent=2))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Explore the states of a rom and find crashes")
+    parser.add_argument("rom", type=Path)
+    parser.add_argument("--out", type=Path, default=Path("explore"), help="directory for the reports")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--rounds", type=int, default=10)
+    parser.add_argument("--iterations", type=int, default=100, help="mutated inputs per worker and round")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--quirks", choices=QUIRK_PROFILES, default="default")
+    parser.add_argument("--replay", type=Path, help="replay a crash script instead of exploring")
+    parser.add_argument("--cache-dir", type=Path, default=DEFAULT_CACHE_DIR, help="where rom analyses are cached")
+    args = parser.parse_args()
+
+    rom_data = read_rom(args.rom)
+    if args.replay:
+        crash_script = json.loads(args.replay.read_text())
+        machine = replay(rom_data, [tuple(step) for step in crash_script["script"]], crash_script["quirks"])
+        print(machine.screen)  # noqa: T201
+    else:
+        explorer = Explorer(rom_data, args.quirks, args.seed, RomCache(args.cache_dir))
+        explorer.run(args.workers, args.rounds, args.iterations)
+        explorer.write_report(args.out)
+        print(f"reached {len(explorer.reached_addresses())} addresses, {len(explorer.crashes)} crashes")  # noqa: T201
@@ -1,6 +1,8 @@
 import random
 import sys
 from array import array
+from collections.abc import Callable
+from contextlib import suppress
 from multiprocessing import Process, Queue
 from multiprocessing.shared_memory import SharedMemory
 from typing import TYPE_CHECKING, Any
@@ -13,13 +15,29 @@ import numpy.typing as npt
 from moderngl_window.context.base import KeyModifiers
 from moderngl_window.integrations.imgui import ModernglWindowRenderer
 
+from .capture import FrameCapture
 from .constants import HEIGHT, WIDTH
-from .debug import DebugInformation, DebugPipe
+from .debug import (
+    RUN_FRAME,
+    RUN_STEPS,
+    RUN_UNTIL_DRAW,
+    RUN_UNTIL_PC,
+    RUN_UNTIL_RETURN,
+    DebugInformation,
+    DebugPipe,
+)
+from .decode import CodeAnalysis
+from .latency import DEQUEUE, TICK, LatencyTrace
+from .monitor import BYTES_PER_ROW, MEMORY_SIZE, MemoryMonitor
+from .screen import Screen
 
 shared_vram = SharedMemory(name="shared_vram", create=True, size=WIDTH * HEIGHT * 3)
-keypress_queue: "Queue[tuple[int, str]]" = Queue()
+keypress_queue: "Queue[tuple[int, str, int]]" = Queue()
 debug_info: DebugInformation = DebugInformation()
 debug_pipe = DebugPipe()
+latency_trace: LatencyTrace | None = None
+memory_monitor: MemoryMonitor | None = None
+load_analysis: Callable[[], CodeAnalysis] | None = None
 
 if TYPE_CHECKING:
     from unittest.mock import Mock
@@ -38,6 +56,9 @@ class GPUDisplayWindow(mglw.WindowConfig):
         super().__init__(**kwargs)
         imgui.create_context()
         self.show_debug = False
+        self.run_to_pc = "200"
+        self.run_steps = "100"
+        self.disassembly: list[str] | None = None
         self.imgui = ModernglWindowRenderer(self.wnd)
         self.program = self.ctx.program(
             vertex_shader="""
@@ -72,12 +93,21 @@ class GPUDisplayWindow(mglw.WindowConfig):
         data = bytearray([random.randint(0, 255) for _ in range(WIDTH) for _ in range(HEIGHT) for _ in range(3)])  # noqa: S311
         self.texture = self.ctx.texture((WIDTH, HEIGHT), 3, data)
         self.texture.filter = (moderngl.NEAREST, moderngl.NEAREST)
+        self.heat_texture = self.ctx.texture((64, 64), 3)
+        self.heat_texture.filter = (moderngl.NEAREST, moderngl.NEAREST)
+        self.imgui.register_texture(self.heat_texture)
 
     def render(self, time: float, frame_time: float) -> None:  # noqa: ARG002
         self.ctx.clear(0.0, 0.0, 0.0)
+        shown = latency_trace.last_shown() if latency_trace else 0
         self.texture.write(shared_vram.buf)
+        if latency_trace:
+            latency_trace.uploaded(shown)
         self.texture.use()
         self.quad.render(moderngl.TRIANGLE_STRIP)
+        if memory_monitor:
+            # fade the heat map every frame, also while the debug window is hidden
+            memory_monitor.decay()
         if self.show_debug:
             self.render_ui()
 
@@ -90,6 +120,48 @@ class GPUDisplayWindow(mglw.WindowConfig):
         imgui.text(f"I  {debug_info.get_register_i()}")
         imgui.text(f"DT {debug_info.get_register_dt()}")
         imgui.text(debug_info.get_data_registers())
+        if latency_trace:
+            for stage, latency in latency_trace.stage_latencies().items():
+                imgui.text(f"{stage:18} p50 {latency['p50_ms']:6.2f}ms  p99 {latency['p99_ms']:6.2f}ms")
+        self.render_debug_controls()
+        self.render_run_commands()
+        imgui.end()
+        if memory_monitor:
+            self.render_memory(memory_monitor)
+        if load_analysis:
+            if self.disassembly is None:
+                self.disassembly = load_analysis().disassembly
+            self.render_code(self.disassembly)
+
+        imgui.render()
+        self.imgui.render(imgui.get_draw_data())
+
+    def render_memory(self, monitor: MemoryMonitor) -> None:
+        self.heat_texture.write(monitor.heat_rgb())
+        imgui.begin("Memory")
+        imgui.image(self.heat_texture.glo, 256, 256)
+        imgui.begin_child("hex", 0, 0, border=True)
+        # only the visible rows get formatted
+        clipper = imgui.ListClipper()
+        clipper.begin(MEMORY_SIZE // BYTES_PER_ROW)
+        while clipper.step():
+            for row in monitor.hex_rows(clipper.display_start, clipper.display_end):
+                imgui.text(row)
+        imgui.end_child()
+        imgui.end()
+
+    def render_code(self, lines: list[str]) -> None:
+        # debug_info is a proxy in the renderer process, it only exposes methods
+        current = f"0x{hex(debug_info.get_pc())[2:].zfill(4).upper()}:"
+        imgui.begin("Code")
+        clipper = imgui.ListClipper()
+        clipper.begin(len(lines))
+        while clipper.step():
+            for line in lines[clipper.display_start : clipper.display_end]:
+                imgui.text(f"> {line}" if line.startswith(current) else f"  {line}")
+        imgui.end()
+
+    def render_debug_controls(self) -> None:
         if debug_pipe.paused:
             if imgui.button("Continue"):
                 debug_pipe.continue_()
@@ -99,10 +171,25 @@ class GPUDisplayWindow(mglw.WindowConfig):
             debug_pipe.reset()
         if imgui.button("Step"):
             debug_pipe.step()
-        imgui.end()
 
-        imgui.render()
-        self.imgui.render(imgui.get_draw_data())
+    def render_run_commands(self) -> None:
+        if imgui.button("Run steps"):
+            with suppress(ValueError):
+                debug_pipe.run(RUN_STEPS, int(self.run_steps))
+        imgui.same_line()
+        _, self.run_steps = imgui.input_text("##run_steps", self.run_steps, 6)
+        if imgui.button("Frame"):
+            debug_pipe.run(RUN_FRAME)
+        if imgui.button("Run to draw"):
+            debug_pipe.run(RUN_UNTIL_DRAW)
+        imgui.same_line()
+        if imgui.button("Step out"):
+            debug_pipe.run(RUN_UNTIL_RETURN)
+        if imgui.button("Run to PC"):
+            with suppress(ValueError):
+                debug_pipe.run(RUN_UNTIL_PC, int(self.run_to_pc, 16))
+        imgui.same_line()
+        _, self.run_to_pc = imgui.input_text("##run_to_pc", self.run_to_pc, 5)
 
     def resize(self, width: int, height: int) -> None:
         self.imgui.resize(width, height)
@@ -152,7 +239,8 @@ class GPUDisplayWindow(mglw.WindowConfig):
         }
         if key not in key_map:
             return
-        keypress_queue.put_nowait((key_map[key], action))
+        event_id = latency_trace.begin() if latency_trace else 0
+        keypress_queue.put_nowait((key_map[key], action, event_id))
         if key in [self.wnd.keys.Q, self.wnd.keys.ESCAPE]:
             self.wnd.close()
 
@@ -160,62 +248,75 @@ class GPUDisplayWindow(mglw.WindowConfig):
 def start_renderer_blocking(
     debug_info_from_main_process: DebugInformation,
     debug_pipe_from_main_process: DebugPipe,
+    latency_trace_from_main_process: LatencyTrace | None,
+    memory_monitor_from_main_process: MemoryMonitor | None,
+    load_analysis_from_main_process: Callable[[], CodeAnalysis] | None,
 ) -> None:
     sys.argv = sys.argv[:1]
-    global debug_info, debug_pipe  # noqa: PLW0603
+    global debug_info, debug_pipe, latency_trace, memory_monitor, load_analysis  # noqa: PLW0603
     debug_info = debug_info_from_main_process
     debug_pipe = debug_pipe_from_main_process
+    latency_trace = latency_trace_from_main_process
+    memory_monitor = memory_monitor_from_main_process
+    load_analysis = load_analysis_from_main_process
     mglw.run_window_config(GPUDisplayWindow)  # type:ignore[]
     shared_vram.close()
     shared_vram.unlink()
-
-
-class Display:
-    def __init__(self, debug_info: DebugInformation, debug_pipe: DebugPipe) -> None:
-        self.screen = [[False for _ in range(WIDTH)] for _ in range(HEIGHT)]
+    if latency_trace:
+        latency_trace.close()
+    if memory_monitor:
+        memory_monitor.close()
+
+
+class Display(Screen):
+    def __init__(  # noqa: PLR0913
+        self,
+        debug_info: DebugInformation,
+        debug_pipe: DebugPipe,
+        capture: FrameCapture | None = None,
+        latency_trace: LatencyTrace | None = None,
+        memory_monitor: MemoryMonitor | None = None,
+        load_analysis: Callable[[], CodeAnalysis] | None = None,
+    ) -> None:
+        super().__init__(capture)
         self.button_state: dict[int, str] = {}
-
-        p = Process(target=start_renderer_blocking, args=[debug_info, debug_pipe])
+        self.vram: npt.NDArray[np.uint8] = np.ndarray((HEIGHT, WIDTH, 3), dtype=np.uint8, buffer=shared_vram.buf)
+        self.latency_trace = latency_trace
+        # traced key events that were dequeued but not ticked yet, and ticked ones that are not on the screen yet
+        self.dequeued_events: list[int] = []
+        self.traced_events: list[int] = []
+
+        p = Process(
+            target=start_renderer_blocking,
+            args=[debug_info, debug_pipe, latency_trace, memory_monitor, load_analysis],
+        )
         p.start()
 
     def show(self) -> None:
-        i = 0
-        for y in range(HEIGHT):
-            for x in range(WIDTH):
-                col = 255 if self.screen[y][x] else 0
-                shared_vram.buf[i] = col
-                i += 1
-                shared_vram.buf[i] = col
-                i += 1
-                shared_vram.buf[i] = col
-                i += 1
+        self.vram[:] = self.screen[:, :, None] * np.uint8(255)
+        if self.latency_trace and self.traced_events:
+            self.latency_trace.shown(self.traced_events)
+            self.traced_events = []
+        super().show()
 
     def pressed_buttons(self) -> set[int]:
         while not keypress_queue.empty():
-            key, action = keypress_queue.get(timeout=1)
+            key, action, event_id = keypress_queue.get(timeout=1)
             self.button_state[key] = action
+            if self.latency_trace and event_id:
+                self.latency_trace.stamp(event_id, DEQUEUE)
+                self.dequeued_events.append(event_id)
         return {k for k, a in self.button_state.items() if a == "ACTION_PRESS"}
 
-    def blit(self, x: np.uint8, y: np.uint8, graphic_data: npt.NDArray[np.uint8]) -> bool:
-        erased = False
-        for i, b in enumerate(graphic_data):
-            for j, bit in enumerate(bin(b)[2:].zfill(8)):
-                y_coord = (y + i) % len(self.screen)
-                x_coord = (x + j) % len(self.screen[0])
-                before = self.screen[y_coord][x_coord]
-                self.screen[y_coord][x_coord] ^= bit == "1"
-                now = self.screen[y_coord][x_coord]
-                if before and not now:
-                    erased = True
-        return erased
-
-    def clear(self) -> None:
-        self.screen = [[False for _ in range(64)] for _ in range(32)]
+    def consume_buttons(self) -> set[int]:
+        buttons = self.pressed_buttons()
+        if self.latency_trace and self.dequeued_events:
+            for event_id in self.dequeued_events:
+                self.latency_trace.stamp(event_id, TICK)
+            self.traced_events += self.dequeued_events
+            self.dequeued_events = []
+        return buttons
 
     def close(self) -> None:
+        del self.vram
         shared_vram.close()
-
-    def __str__(self) -> str:
-        lines = ["+" + "".join("█" if e else " " for e in row) + "+" for row in self.screen]
-        top_bot = ["+" * len(lines[0])]
-        return "\n".join(top_bot + lines + top_bot)
@@ -0,0 +1,85 @@
+import json
+import time
+from multiprocessing.shared_memory import SharedMemory
+from pathlib import Path
+
+import numpy as np
+
+# the hops of a key press from the renderer window through the emulator back to the screen
+STAGES = ["key_event", "dequeue", "tick", "show", "upload"]
+KEY_EVENT, DEQUEUE, TICK, SHOW, UPLOAD = range(len(STAGES))
+CAPACITY = 1024
+
+
+class LatencyTrace:
+    def __init__(self, capacity: int = CAPACITY) -> None:
+        # ring buffer in shared memory, the renderer process writes into the same rows as the emulator:
+        # a header with [last event id, last shown event id] and per event [event id, *timestamps]
+        self.capacity = capacity
+        self.shm = SharedMemory(create=True, size=(2 + capacity * (1 + len(STAGES))) * 8)
+        data = np.ndarray(2 + capacity * (1 + len(STAGES)), dtype=np.int64, buffer=self.shm.buf)
+        data.fill(0)
+        self.header = data[:2]
+        self.events = data[2:].reshape(capacity, 1 + len(STAGES))
+        self.last_uploaded = 0
+
+    def begin(self) -> int:
+        event_id = int(self.header[0]) + 1
+        row = self.events[event_id % self.capacity]
+        row.fill(0)
+        row[0] = event_id
+        row[1 + KEY_EVENT] = time.monotonic_ns()
+        self.header[0] = event_id
+        return event_id
+
+    def stamp(self, event_id: int, stage: int) -> None:
+        row = self.events[event_id % self.capacity]
+        if row[0] == event_id:
+            row[1 + stage] = time.monotonic_ns()
+
+    def shown(self, event_ids: list[int]) -> None:
+        for event_id in event_ids:
+            self.stamp(event_id, SHOW)
+        self.header[1] = event_ids[-1]
+
+    def last_shown(self) -> int:
+        return int(self.header[1])
+
+    def uploaded(self, shown: int) -> None:
+        # shown has to be read before the upload, later events may not be in the uploaded frame
+        for event_id in range(max(self.last_uploaded, shown - self.capacity) + 1, shown + 1):
+            self.stamp(event_id, UPLOAD)
+        self.last_uploaded = shown
+
+    def stage_latencies(self) -> dict[str, dict[str, float]]:
+        events = self.events[self.events[:, 0] > 0, 1:]
+        stages = [(i, i + 1) for i in range(len(STAGES) - 1)] + [(KEY_EVENT, UPLOAD)]
+        latencies = {}
+        for start, end in stages:
+            complete = (events[:, start] > 0) & (events[:, end] > 0)
+            durations = (events[complete, end] - events[complete, start]) / 1e6
+            if not len(durations):
+                continue
+            latencies[f"{STAGES[start]}->{STAGES[end]}"] = {
+                "count": len(durations),
+                "p50_ms": float(np.percentile(durations, 50)),
+                "p99_ms": float(np.percentile(durations, 99)),
+            }
+        return latencies
+
+    def dump(self, path: Path) -> None:
+        rows = self.events[self.events[:, 0] > 0]
+        rows = rows[np.argsort(rows[:, 0])]
+        report = {
+            "stages": STAGES,
+            "latencies": self.stage_latencies(),
+            "events": rows.tolist(),
+        }
+        path.write_text(json.dumps(report, indent=2))
+
+    def close(self) -> None:
+        del self.header, self.events
+        self.shm.close()
+
+    def unlink(self) -> None:
+        self.shm.unlink()
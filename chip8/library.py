@@ -0,0 +1,104 @@
+import argparse
+import json
+import re
+from collections import Counter
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+
+from .cache import DEFAULT_CACHE_DIR, RomCache, rom_hash
+from .decode import FLAG_CODE, INSTRUCTIONS, UNKNOWN, analyze
+from .memory import Memory
+
+LIBRARY_VERSION = 1
+ROM_SUFFIXES = {".ch8", ".c8", ".rom"}
+# instructions whose behaviour depends on the quirk profile
+QUIRK_INSTRUCTIONS = {
+    "8xy6": "shift",
+    "8xyE": "shift",
+    "Fx55": "index_increment",
+    "Fx65": "index_increment",
+    "Bnnn": "jump_offset",
+}
+
+
+def rom_title(rom_file: Path) -> str:
+    # "Tetris [Fran Dachille, 1991].ch8" -> "Tetris"
+    return re.sub(r"\s*[\[(][^\])]*[\])]", "", rom_file.stem).strip() or rom_file.stem
+
+
+def describe_rom(rom_data: npt.NDArray[np.uint8], cache: RomCache | None = None) -> dict[str, Any]:
+    code = (cache.load(rom_data) if cache else analyze(rom_data)).code
+    kinds = code["kind"][(code["flags"] & FLAG_CODE) > 0]
+    histogram = Counter(INSTRUCTIONS[kind] if kind != UNKNOWN else "????" for kind in kinds)
+    return {
+        "size": len(rom_data),
+        "quirks": sorted({QUIRK_INSTRUCTIONS[inst] for inst in histogram if inst in QUIRK_INSTRUCTIONS}),
+        "histogram": dict(sorted(histogram.items())),
+    }
+
+
+def build_library(directories: list[Path], archive: Path, cache: RomCache | None = None) -> dict[str, dict[str, Any]]:
+    # all roms are concatenated into one archive file, the json index next to it is keyed by content hash
+    roms: dict[str, dict[str, Any]] = {}
+    chunks = []
+    offset = 0
+    rom_files = sorted(f for d in directories for f in d.rglob("*") if f.suffix.lower() in ROM_SUFFIXES)
+    for rom_file in rom_files:
+        rom_data = np.fromfile(rom_file, dtype=np.uint8)
+        key = rom_hash(rom_data)
+        if key in roms:
+            roms[key]["files"].append(rom_file.name)
+            continue
+        entry = {"offset": offset, "title": rom_title(rom_file), "files": [rom_file.name]}
+        roms[key] = entry | describe_rom(rom_data, cache)
+        chunks.append(rom_data.tobytes())
+        offset += len(rom_data)
+
+    archive.parent.mkdir(parents=True, exist_ok=True)
+    archive.write_bytes(b"".join(chunks))
+    archive.with_suffix(".json").write_text(json.dumps({"version": LIBRARY_VERSION, "roms": roms}, indent=2))
+    return roms
+
+
+class RomLibrary:
+    def __init__(self, archive: Path) -> None:
+        index = json.loads(archive.with_suffix(".json").read_text())
+        assert index["version"] == LIBRARY_VERSION
+        self.roms: dict[str, dict[str, Any]] = index["roms"]
+        # roms are views on the mapped archive, nothing is read until a rom is loaded
+        self.data: npt.NDArray[np.uint8] = (
+            np.memmap(archive, dtype=np.uint8, mode="r") if archive.stat().st_size else np.zeros(0, dtype=np.uint8)
+        )
+
+    def rom(self, key: str) -> npt.NDArray[np.uint8]:
+        entry = self.roms[key]
+        return self.data[entry["offset"] : entry["offset"] + entry["size"]]
+
+    def find(self, title: str) -> list[str]:
+        return [key for key, entry in self.roms.items() if entry["title"].lower() == title.lower()]
+
+    def load_into(self, memory: Memory, key: str) -> None:
+        memory.load_rom(self.rom(key))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Pack roms into a memory-mapped library")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    build_parser = subparsers.add_parser("build", help="scan directories and write a library")
+    build_parser.add_argument("directories", type=Path, nargs="+")
+    build_parser.add_argument("--out", type=Path, default=Path("roms.lib"), help="archive file, the index is .json")
+    build_parser.add_argument("--cache-dir", type=Path, default=DEFAULT_CACHE_DIR, help="where rom analyses are cached")
+    list_parser = subparsers.add_parser("list", help="show the roms of a library")
+    list_parser.add_argument("archive", type=Path)
+    args = parser.parse_args()
+
+    if args.command == "build":
+        built = build_library(args.directories, args.out, RomCache(args.cache_dir))
+        print(f"packed {len(built)} roms into {args.out}")  # noqa: T201
+    else:
+        library = RomLibrary(args.archive)
+        for key, entry in library.roms.items():
+            print(f"{key[:12]}  {entry['size']:5}  {entry['title']:30}  {','.join(entry['quirks'])}")  # noqa: T201
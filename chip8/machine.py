@@ -0,0 +1,92 @@
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+
+from .cache import RomCache
+from .constants import TICKS_PER_FRAME
+from .cpu import CPU
+from .data import read_rom
+from .decode import CodeAnalysis, analyze
+from .memory import Memory
+from .quirks import QUIRK_PROFILES, Quirks
+from .screen import Screen
+from .sound import SilentSound
+
+
+class MachineState:
+    def __init__(self, machine: "Machine") -> None:
+        cpu = machine.cpu
+        self.memory = machine.memory.memory.copy()
+        self.screen = machine.screen.screen.copy()
+        self.keys = set(machine.screen.keys)
+        self.data_registers = cpu.data_registers.copy()
+        self.register_I = cpu.register_I
+        self.register_DT = cpu.register_DT
+        self.register_PC = cpu.register_PC
+        self.stack = list(cpu.stack)
+        self.wait_for_input_reg = cpu.wait_for_input_reg
+        self.rng_state: tuple[Any, ...] = cpu.rng.getstate()
+
+
+class Machine:
+    def __init__(self, cache: RomCache | None = None, quirks: Quirks = QUIRK_PROFILES["default"]) -> None:
+        self.cache = cache
+        self.rom_data = np.zeros(0, dtype=np.uint8)
+        self._analysis: CodeAnalysis | None = None
+        self.memory = Memory()
+        self.screen = Screen()
+        self.cpu = CPU(self.memory, self.screen, SilentSound(), quirks=quirks)
+        # read-only view on the screen, it always shows the current frame without copying
+        self.framebuffer: npt.NDArray[np.bool_] = self.screen.screen.view()
+        self.framebuffer.flags.writeable = False
+
+    def load(self, rom: Path | bytes | npt.NDArray[np.uint8]) -> None:
+        self.rom_data = read_rom(rom) if isinstance(rom, Path) else np.frombuffer(rom, dtype=np.uint8)
+        self._analysis = None
+        self.memory.clear()
+        self.memory.load_rom(self.rom_data)
+        self.reset()
+
+    @property
+    def analysis(self) -> CodeAnalysis:
+        # decoding the rom is only done (or read from the cache) when someone asks for it
+        if self._analysis is None:
+            self._analysis = self.cache.load(self.rom_data) if self.cache else analyze(self.rom_data)
+        return self._analysis
+
+    def reset(self) -> None:
+        self.cpu.reset()
+        self.screen.clear()
+
+    def step(self, n: int = 1) -> None:
+        tick = self.cpu.tick
+        for _ in range(n):
+            tick()
+
+    def run_frames(self, n: int = 1) -> None:
+        self.step(n * TICKS_PER_FRAME)
+
+    def set_keys(self, mask: int) -> None:
+        self.screen.set_keys(mask)
+
+    def seed(self, seed: int) -> None:
+        self.cpu.rng.seed(seed)
+
+    def snapshot(self) -> MachineState:
+        return MachineState(self)
+
+    def restore(self, state: MachineState) -> None:
+        # arrays are copied in place, so the framebuffer view stays valid
+        cpu = self.cpu
+        self.memory.memory[:] = state.memory
+        self.screen.screen[:] = state.screen
+        self.screen.keys = set(state.keys)
+        cpu.data_registers[:] = state.data_registers
+        cpu.register_I = state.register_I
+        cpu.register_DT = state.register_DT
+        cpu.register_PC = state.register_PC
+        cpu.stack = list(state.stack)
+        cpu.wait_for_input_reg = state.wait_for_input_reg
+        cpu.rng.setstate(state.rng_state)
@@ -13,21 +13,25 @@ class Memory:
         self.memory = np.asarray([0] * 4096, dtype=np.uint8)
         self.load_fonts()
 
+    def clear(self) -> None:
+        self.memory.fill(0)
+        self.load_fonts()
+
     def load_fonts(self) -> None:
         font_data = FONT_DATA
         self.memory[0 : len(font_data)] = font_data
 
     def load_rom(self, rom_data: npt.NDArray[np.uint8]) -> None:
         assert MEMORY_START_ROM + len(rom_data) < MEMORY_START_INTERNAL
-        for b in rom_data:
-            assert 0 <= b < 2**8
-        for i, b in enumerate(rom_data):
-            self.memory[MEMORY_START_ROM + i] = b
+        assert rom_data.dtype == np.uint8
+        self.memory[MEMORY_START_ROM : MEMORY_START_ROM + len(rom_data)] = rom_data
 
     def read_op(self, address: np.uint16) -> np.uint16:
-        read_bytes = self.read_bytes(address, np.uint8(2))
-        assert len(read_bytes) == 2  # noqa: PLR2004
-        return read_bytes.view(np.uint16).byteswap()[0]
+        assert 0 <= address < address + 2 < 2**12  # 12 bits address
+        return self.memory[address : address + 2].view(np.uint16).byteswap()[0]
+
+    # reads the operation without counting as an execution, subclasses only override read_op
+    peek_op = read_op
 
     def read_bytes(self, address: np.uint16, num: np.uint8) -> npt.NDArray[np.uint8]:
         assert 0 <= address < address + num < 2**12  # 12 bits address
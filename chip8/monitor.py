@@ -0,0 +1,72 @@
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+import numpy.typing as npt
+
+from .memory import Memory
+
+MEMORY_SIZE = 4096
+BYTES_PER_ROW = 16
+# rows of the heat map, shown as the red, green and blue channel
+WRITE, READ, EXECUTE = range(3)
+# the heat map fades to a tenth in about one second at 60 fps
+DECAY = 0.96
+
+
+class MemoryMonitor:
+    def __init__(self) -> None:
+        # the memory contents and the access counts live in shared memory so the renderer process can show them
+        self.shm = SharedMemory(create=True, size=MEMORY_SIZE + 3 * MEMORY_SIZE * 4)
+        self.memory: npt.NDArray[np.uint8] = np.ndarray(MEMORY_SIZE, dtype=np.uint8, buffer=self.shm.buf)
+        self.heat: npt.NDArray[np.float32] = np.ndarray(
+            (3, MEMORY_SIZE),
+            dtype=np.float32,
+            buffer=self.shm.buf,
+            offset=MEMORY_SIZE,
+        )
+        self.memory.fill(0)
+        self.heat.fill(0)
+
+    def decay(self) -> None:
+        self.heat *= np.float32(DECAY)
+
+    def heat_rgb(self) -> bytes:
+        # one pixel per byte, 64 x 64 pixels with a logarithmic scale
+        intensity: npt.NDArray[np.uint8] = np.minimum(np.log1p(self.heat) * 48, 255).astype(np.uint8)
+        rgb: bytes = intensity.T.reshape(64, 64, 3).tobytes()
+        return rgb
+
+    def hex_rows(self, first: int, last: int) -> list[str]:
+        rows = []
+        for row in range(first, last):
+            address = row * BYTES_PER_ROW
+            data = bytes(self.memory[address : address + BYTES_PER_ROW]).hex(" ").upper()
+            rows.append(f"0x{hex(address)[2:].zfill(3).upper()}  {data}")
+        return rows
+
+    def close(self) -> None:
+        del self.memory, self.heat
+        self.shm.close()
+
+    def unlink(self) -> None:
+        self.shm.unlink()
+
+
+class TracedMemory(Memory):
+    def __init__(self, monitor: MemoryMonitor) -> None:
+        super().__init__()
+        monitor.memory[:] = self.memory
+        self.memory = monitor.memory
+        self.heat = monitor.heat
+
+    def read_op(self, address: np.uint16) -> np.uint16:
+        self.heat[EXECUTE, address : address + 2] += 1
+        return super().read_op(address)
+
+    def read_bytes(self, address: np.uint16, num: np.uint8) -> npt.NDArray[np.uint8]:
+        self.heat[READ, address : address + num] += 1
+        return super().read_bytes(address, num)
+
+    def set_byte(self, address: np.uint16, value: np.uint8) -> None:
+        self.heat[WRITE, address] += 1
+        super().set_byte(address, value)
@@ -0,0 +1,46 @@
+from dataclasses import dataclass
+from enum import Enum
+
+
+class IndexIncrement(Enum):
+    # how Fx55/Fx65 change I after storing/loading V0 through Vx
+    NONE = "none"
+    X = "x"
+    X_PLUS_ONE = "x+1"
+
+
+@dataclass(frozen=True)
+class Quirks:
+    shift_uses_vy: bool  # 8xy6/8xyE shift Vy into Vx instead of shifting Vx
+    index_increment: IndexIncrement
+    clip_sprites: bool  # Dxyn clips sprites at the screen border instead of wrapping them
+    jump_uses_vx: bool  # Bxnn jumps to xnn + Vx instead of nnn + V0
+
+
+QUIRK_PROFILES = {
+    # the behaviour of this emulator before quirk profiles existed
+    "default": Quirks(
+        shift_uses_vy=False,
+        index_increment=IndexIncrement.NONE,
+        clip_sprites=False,
+        jump_uses_vx=False,
+    ),
+    "cosmac-vip": Quirks(
+        shift_uses_vy=True,
+        index_increment=IndexIncrement.X_PLUS_ONE,
+        clip_sprites=True,
+        jump_uses_vx=False,
+    ),
+    "chip-48": Quirks(
+        shift_uses_vy=False,
+        index_increment=IndexIncrement.X,
+        clip_sprites=True,
+        jump_uses_vx=True,
+    ),
+    "super-chip": Quirks(
+        shift_uses_vy=False,
+        index_increment=IndexIncrement.NONE,
+        clip_sprites=True,
+        jump_uses_vx=True,
+    ),
+}
@@ -0,0 +1,71 @@
+from typing import TYPE_CHECKING
+
+import numpy as np
+import numpy.typing as npt
+
+from .constants import HEIGHT, WIDTH
+
+if TYPE_CHECKING:
+    from .capture import FrameCapture
+
+
+def sprite_pixels(graphic_data: npt.NDArray[np.uint8]) -> npt.NDArray[np.bool_]:
+    return np.unpackbits(np.asarray(graphic_data, dtype=np.uint8)).reshape(-1, 8).astype(np.bool_)
+
+
+class Screen:
+    def __init__(self, capture: "FrameCapture | None" = None) -> None:
+        # the array is only ever modified in place, so views on it stay valid
+        self.screen = np.zeros((HEIGHT, WIDTH), dtype=np.bool_)
+        self.keys: set[int] = set()
+        self.capture = capture
+
+    def show(self) -> None:
+        if self.capture:
+            self.capture.capture(self.screen)
+
+    def idle(self) -> None:
+        # called instead of show for ticks that didn't execute anything
+        if self.capture:
+            self.capture.skip()
+
+    def pressed_buttons(self) -> set[int]:
+        return self.keys
+
+    def consume_buttons(self) -> set[int]:
+        # the buttons a cpu tick acts on, frontends hook in here to trace when input reaches the emulation
+        return self.pressed_buttons()
+
+    def set_keys(self, mask: int) -> None:
+        self.keys = {key for key in range(16) if mask >> key & 1}
+
+    def blit(self, x: np.uint8, y: np.uint8, graphic_data: npt.NDArray[np.uint8]) -> bool:
+        # pixels outside of the screen wrap around to the other side
+        sprite = sprite_pixels(graphic_data)
+        rows = (int(y) + np.arange(len(sprite))) % HEIGHT
+        cols = (int(x) + np.arange(8)) % WIDTH
+        region = np.ix_(rows, cols)
+        erased = bool((self.screen[region] & sprite).any())
+        self.screen[region] ^= sprite
+        return erased
+
+    def blit_clipped(self, x: np.uint8, y: np.uint8, graphic_data: npt.NDArray[np.uint8]) -> bool:
+        # only the start position wraps around, pixels outside of the screen are dropped
+        top = int(y) % HEIGHT
+        left = int(x) % WIDTH
+        sprite = sprite_pixels(graphic_data)[: HEIGHT - top, : WIDTH - left]
+        region = self.screen[top : top + sprite.shape[0], left : left + sprite.shape[1]]
+        erased = bool((region & sprite).any())
+        region ^= sprite
+        return erased
+
+    def clear(self) -> None:
+        self.screen.fill(False)  # noqa: FBT003
+
+    def close(self) -> None:
+        pass
+
+    def __str__(self) -> str:
+        lines = ["+" + "".join("█" if e else " " for e in row) + "+" for row in self.screen]
+        top_bot = ["+" * len(lines[0])]
+        return "\n".join(top_bot + lines + top_bot)
@@ -1,8 +1,6 @@
 import wave
 from multiprocessing import Process, Queue
 
-import pyaudio
-
 CHUNK = 2048
 
 
@@ -19,6 +17,8 @@ class Sound:
         self.queue.put_nowait(-1)
 
     def sound_loop_task(self) -> None:
+        import pyaudio  # noqa: PLC0415
+
         wf: wave.Wave_read = wave.open("./sound/chirp.wav")
         p = pyaudio.PyAudio()
         stream = p.open(
@@ -36,3 +36,11 @@ class Sound:
         # cleanup stuff.
         stream.close()
         p.terminate()
+
+
+class SilentSound:
+    def play(self, value: int) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
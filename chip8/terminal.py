@@ -0,0 +1,81 @@
+import os
+import re
+import select
+import sys
+import termios
+import tty
+from typing import TextIO
+
+import numpy as np
+import numpy.typing as npt
+
+from .capture import FrameCapture
+from .constants import HEIGHT, WIDTH
+from .screen import Screen
+
+# every character cell shows two pixel rows: (top, bottom) -> glyph
+GLYPHS = np.asarray([" ", "▄", "▀", "█"])
+KEY_MAP = {key: int(key, 16) for key in "0123456789abcdef"} | {"q": -1, "\x1b": -1}
+# sent by special keys like the arrows, a lone escape is the escape key itself
+ESCAPE_SEQUENCE = re.compile(r"\x1b(\[[0-?]*[ -/]*[@-~]|O.)")
+# terminals only report key presses, so a key stays pressed for this many ticks
+KEY_HOLD_TICKS = 20
+
+
+def render_rows(screen: npt.NDArray[np.bool_]) -> list[str]:
+    cells = GLYPHS[screen[0::2].astype(np.uint8) * 2 + screen[1::2]]
+    return ["".join(row) for row in cells]
+
+
+class TerminalDisplay(Screen):
+    def __init__(
+        self,
+        capture: FrameCapture | None = None,
+        output: TextIO = sys.stdout,
+        keyboard: TextIO = sys.stdin,
+    ) -> None:
+        super().__init__(capture)
+        self.output = output
+        self.held_keys: dict[int, int] = {}
+        self.last_screen = np.zeros_like(self.screen)
+        self.keyboard_fd: int | None = None
+        if keyboard.isatty():
+            self.keyboard_fd = keyboard.fileno()
+            self.keyboard_attributes = termios.tcgetattr(self.keyboard_fd)
+            tty.setcbreak(self.keyboard_fd)
+        # hide the cursor, clear the terminal and draw the border once
+        border = "+" * (WIDTH + 2)
+        rows = [border] + ["+" + " " * WIDTH + "+"] * (HEIGHT // 2) + [border]
+        self.output.write("\x1b[?25l\x1b[2J\x1b[H" + "\n".join(rows))
+        self.output.flush()
+
+    def show(self) -> None:
+        changed_rows = (self.screen != self.last_screen).reshape(HEIGHT // 2, 2 * WIDTH).any(axis=1)
+        if changed_rows.any():
+            rows = np.flatnonzero(changed_rows)
+            lines = render_rows(self.screen[rows.repeat(2) * 2 + np.tile([0, 1], len(rows))])
+            self.output.write("".join(f"\x1b[{row + 2};2H{line}" for row, line in zip(rows, lines, strict=True)))
+            self.output.flush()
+            self.last_screen[:] = self.screen
+        for key in list(self.held_keys):
+            self.held_keys[key] -= 1
+            if not self.held_keys[key]:
+                del self.held_keys[key]
+        super().show()
+
+    def pressed_buttons(self) -> set[int]:
+        if self.keyboard_fd is not None:
+            while select.select([self.keyboard_fd], [], [], 0)[0]:
+                self.press(os.read(self.keyboard_fd, 64).decode(errors="ignore"))
+        return set(self.held_keys)
+
+    def press(self, chars: str) -> None:
+        for char in ESCAPE_SEQUENCE.sub("", chars).lower():
+            if char in KEY_MAP:
+                self.held_keys[KEY_MAP[char]] = KEY_HOLD_TICKS
+
+    def close(self) -> None:
+        if self.keyboard_fd is not None:
+            termios.tcsetattr(self.keyboard_fd, termios.TCSADRAIN, self.keyboard_attributes)
+        self.output.write(f"\x1b[{HEIGHT // 2 + 3};1H\x1b[?25h")
+        self.output.flush()
@@ -0,0 +1,48 @@
+import json
+from pathlib import Path
+
+import numpy as np
+
+from chip8 import Machine
+from chip8.cache import RomCache, rom_hash
+
+ROM = np.frombuffer(bytes.fromhex("6005 F029 D115 1206"), dtype=np.uint8)
+
+
+def test_cache_hit_is_memory_mapped(tmp_path: Path):
+    cache = RomCache(tmp_path)
+    analysis = cache.load(ROM)
+    key = rom_hash(ROM)
+    assert (tmp_path / f"{key}.npy").exists()
+    assert (tmp_path / f"{key}.json").exists()
+
+    cached = cache.load(ROM)
+    assert isinstance(cached.code, np.memmap)
+    assert cached.disassembly == analysis.disassembly
+    assert np.array_equal(cached.code, analysis.code)
+
+
+def test_cache_ignores_other_versions(tmp_path: Path):
+    cache = RomCache(tmp_path)
+    cache.load(ROM)
+    meta_file = tmp_path / f"{rom_hash(ROM)}.json"
+    meta_file.write_text(json.dumps({"version": -1, "disassembly": []}))
+
+    assert cache.read(rom_hash(ROM)) is None
+    assert cache.load(ROM).disassembly
+    assert json.loads(meta_file.read_text())["disassembly"]
+
+
+def test_machine_analysis_is_lazy(tmp_path: Path):
+    machine = Machine(RomCache(tmp_path))
+    machine.load(ROM)
+    assert not list(tmp_path.iterdir())
+    assert machine.analysis.instruction_addresses().tolist() == [0x200, 0x202, 0x204, 0x206]
+    assert machine.analysis is machine.analysis
+    assert len(list(tmp_path.iterdir())) == 2
+
+
+def test_unwritable_cache_still_analyzes(tmp_path: Path):
+    (tmp_path / "file").write_text("")
+    analysis = RomCache(tmp_path / "file" / "cache").load(ROM)
+    assert analysis.instruction_addresses().tolist() == [0x200, 0x202, 0x204, 0x206]
@@ -0,0 +1,75 @@
+import logging
+from pathlib import Path
+
+import numpy as np
+import pytest
+from PIL import Image, ImageSequence
+
+from chip8.capture import FrameCapture
+from chip8.constants import HEIGHT, WIDTH
+from chip8.cpu import CPU
+from chip8.memory import Memory
+from chip8.screen import Screen
+from chip8.sound import SilentSound
+
+
+def make_frames() -> list[np.ndarray]:
+    blank = np.zeros((HEIGHT, WIDTH), dtype=np.bool_)
+    dot = blank.copy()
+    dot[3, 5] = True
+    return [blank] * 4 + [dot] * 6 + [blank] * 2
+
+
+def test_gif_merges_identical_frames(tmp_path: Path):
+    path = tmp_path / "capture.gif"
+    capture = FrameCapture(path, scale=1)
+    for frame in make_frames():
+        capture.capture(frame)
+    capture.close()
+
+    with Image.open(path) as image:
+        assert image.info["loop"] == 0
+        frames = [
+            (frame.info["duration"], frame.convert("L").getpixel((5, 3))) for frame in ImageSequence.Iterator(image)
+        ]
+    assert frames == [(20, 0), (30, 255), (10, 0)]
+
+
+def test_png_sequence_every_nth_frame(tmp_path: Path):
+    capture = FrameCapture(tmp_path, every=3, scale=2)
+    for frame in make_frames():
+        capture.capture(frame)
+    capture.close()
+
+    files = sorted(p.name for p in tmp_path.iterdir())
+    assert files == ["frame_00000000.png", "frame_00000006.png"]
+    with Image.open(tmp_path / files[1]) as image:
+        assert image.size == (WIDTH * 2, HEIGHT * 2)
+        assert image.convert("L").getpixel((10, 6)) == 255
+
+
+def test_waiting_for_a_key_advances_the_capture(tmp_path: Path):
+    capture = FrameCapture(tmp_path, scale=1)
+    memory = Memory()
+    # wait for a key, then draw the font sprite for 0
+    memory.load_rom(np.frombuffer(bytes.fromhex("F00A A000 D005"), dtype=np.uint8))
+    screen = Screen(capture)
+    cpu = CPU(memory, screen, SilentSound())
+    for _ in range(10):
+        cpu.tick()
+    screen.set_keys(1)
+    for _ in range(3):
+        cpu.tick()
+    capture.close()
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["frame_00000000.png", "frame_00000012.png"]
+
+
+def test_dropped_frames_are_reported(tmp_path: Path, caplog: pytest.LogCaptureFixture):
+    capture = FrameCapture(tmp_path)
+    for frame in make_frames()[:4]:
+        capture.capture(frame)
+    capture.dropped = 3
+    with caplog.at_level(logging.WARNING):
+        capture.close()
+    assert "dropped 3 of 4 frames" in caplog.text
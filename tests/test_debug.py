@@ -0,0 +1,63 @@
+import pytest
+
+from chip8 import Machine
+from chip8.constants import TICKS_PER_FRAME
+from chip8.debug import RUN_FRAME, RUN_STEPS, RUN_UNTIL_DRAW, RUN_UNTIL_PC, RUN_UNTIL_RETURN, DebugInformation
+
+# 0x200: CALL 0x208, 0x202: CLS, 0x204: ADD V0 1, 0x206: JP 0x204
+# 0x208: ADD V1 1, 0x20A: ADD V1 1, 0x20C: RET
+ROM = bytes.fromhex("2208 00E0 7001 1204 7101 7101 00EE")
+
+
+@pytest.fixture
+def machine() -> Machine:
+    machine = Machine()
+    machine.load(ROM)
+    return machine
+
+
+@pytest.mark.parametrize(
+    ("command", "argument", "pc"),
+    [
+        (RUN_STEPS, 3, 0x20C),
+        (RUN_FRAME, 0, [0x208, 0x20A, 0x20C, 0x202, 0x204][TICKS_PER_FRAME - 1]),
+        (RUN_UNTIL_PC, 0x206, 0x206),
+        (RUN_UNTIL_DRAW, 0, 0x204),
+    ],
+)
+def test_run_command(machine: Machine, command: str, argument: int, pc: int):
+    machine.cpu.run_command(command, argument)
+    assert machine.cpu.register_PC == pc
+
+
+def test_run_until_return(machine: Machine):
+    machine.step(1)
+    machine.cpu.run_command(RUN_UNTIL_RETURN, 0)
+    assert machine.cpu.register_PC == 0x202
+    assert machine.cpu.data_registers[1] == 2
+
+
+def test_run_until_return_outside_of_subroutine(machine: Machine):
+    machine.cpu.run_command(RUN_UNTIL_RETURN, 0)
+    assert machine.cpu.register_PC == 0x200
+    assert not machine.cpu.data_registers.any()
+
+
+def test_run_until_pc_at_the_current_pc_runs_one_iteration(machine: Machine):
+    machine.step(5)
+    assert machine.cpu.register_PC == 0x204
+    machine.cpu.run_command(RUN_UNTIL_PC, 0x204)
+    assert machine.cpu.register_PC == 0x204
+    assert machine.cpu.data_registers[0] == 1
+
+
+def test_run_command_stops_after_max_ticks(machine: Machine):
+    machine.cpu.run_until(lambda: False, 10)
+    assert machine.cpu.data_registers[0] == 3
+
+
+def test_process_synced_debug_information():
+    debug_info = DebugInformation.create_process_synced()
+    debug_info.update(0x00E0, 0, 0, 0x202, [0] * 16, [])
+    assert debug_info.get_pc() == 0x202
+    assert debug_info.get_instruction() == "0x00E0 - CLS"
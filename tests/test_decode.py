@@ -0,0 +1,44 @@
+import numpy as np
+import pytest
+
+from chip8.decode import FLAG_CODE, INSTRUCTIONS, KIND_TABLE, UNKNOWN, analyze, disassemble
+
+
+@pytest.mark.parametrize(
+    ("operation", "instruction"),
+    [
+        (0x00E0, "00E0"),
+        (0x00EE, "00EE"),
+        (0x0123, "0nnn"),
+        (0x1ABC, "1nnn"),
+        (0x5120, "5xy0"),
+        (0x812E, "8xyE"),
+        (0xB200, "Bnnn"),
+        (0xD125, "Dxyn"),
+        (0xE19E, "Ex9E"),
+        (0xF165, "Fx65"),
+    ],
+)
+def test_kind_table(operation: int, instruction: str):
+    assert INSTRUCTIONS[KIND_TABLE[operation]] == instruction
+
+
+@pytest.mark.parametrize("operation", [0x5121, 0x8128, 0xE100, 0xF1FF])
+def test_kind_table_unknown(operation: int):
+    assert KIND_TABLE[operation] == UNKNOWN
+
+
+def test_disassemble():
+    assert disassemble(0x6A2F) == "0x6A2F - LD Va: 0x2F"
+    assert disassemble(0xD125) == "0xD125 - DRW V1, V2: 0x05"
+    assert disassemble(0x2208) == "0x2208 - CALL 0x0208"
+
+
+def test_analyze_separates_code_from_data():
+    # 0x200: CALL 0x20A, 0x202: SE V0 0, 0x204: JP 0x200, 0x206: JP 0x206, 0x208: data, 0x20A: RET
+    rom = np.frombuffer(bytes.fromhex("220A 3000 1200 1206 FFFF 00EE"), dtype=np.uint8)
+    analysis = analyze(rom)
+    assert analysis.instruction_addresses().tolist() == [0x200, 0x202, 0x204, 0x206, 0x20A]
+    assert analysis.block_starts().tolist() == [0x200, 0x202, 0x204, 0x206, 0x20A]
+    assert not analysis.code["flags"][8] & FLAG_CODE
+    assert analysis.disassembly[-1] == "0x020A: 0x00EE - RET"
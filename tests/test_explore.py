@@ -0,0 +1,35 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from chip8.explore import Explorer, replay
+
+# V0 = 5, loop until key 5 is pressed, then run into an unknown instruction
+ROM = np.frombuffer(bytes.fromhex("6005 E09E 1202 FFFF"), dtype=np.uint8)
+
+
+def test_explorer_finds_crash(tmp_path: Path):
+    explorer = Explorer(ROM, seed=1)
+    explorer.run(workers=2, rounds=3, iterations=20)
+    assert explorer.reached_addresses() == [0x200, 0x202, 0x204, 0x206]
+
+    [crash] = explorer.crashes.values()
+    assert crash.error == "NotImplementedError: ffff"
+    assert crash.pc == 0x206
+    with pytest.raises(NotImplementedError):
+        replay(ROM, crash.script)
+
+    explorer.write_report(tmp_path)
+    assert (tmp_path / "coverage.json").exists()
+    assert (tmp_path / "crash_000.json").exists()
+
+
+def test_replay_is_deterministic():
+    # V0 = random byte, store it at 0x300
+    rom = np.frombuffer(bytes.fromhex("C0FF A300 F055 1206"), dtype=np.uint8)
+    script = [(0, 0, 42), (0, 2, None)]
+    first = replay(rom, script)
+    second = replay(rom, script)
+    assert first.memory.memory[0x300] == second.memory.memory[0x300]
+    assert first.cpu.rng.getstate() == second.cpu.rng.getstate()
@@ -0,0 +1,50 @@
+import json
+from itertools import pairwise
+from pathlib import Path
+
+import pytest
+
+from chip8.latency import DEQUEUE, STAGES, TICK, UPLOAD, LatencyTrace
+
+
+@pytest.fixture
+def trace():
+    trace = LatencyTrace(capacity=4)
+    yield trace
+    trace.close()
+    trace.unlink()
+
+
+def test_events_pass_all_stages(trace: LatencyTrace, tmp_path: Path):
+    first = trace.begin()
+    second = trace.begin()
+    for event_id in (first, second):
+        trace.stamp(event_id, DEQUEUE)
+        trace.stamp(event_id, TICK)
+    trace.shown([first, second])
+    shown = trace.last_shown()
+    # shown while the frame is uploaded, it is only in the next upload
+    later = trace.begin()
+    trace.shown([later])
+    trace.uploaded(shown)
+
+    latencies = trace.stage_latencies()
+    assert list(latencies) == [f"{a}->{b}" for a, b in pairwise(STAGES)] + ["key_event->upload"]
+    assert all(latency["count"] == 2 for latency in latencies.values())
+    assert all(0 <= latency["p50_ms"] <= latency["p99_ms"] for latency in latencies.values())
+
+    trace.dump(tmp_path / "latency.json")
+    report = json.loads((tmp_path / "latency.json").read_text())
+    assert [row[0] for row in report["events"]] == [first, second, later]
+    assert all(all(row[1:]) for row in report["events"][:2])
+    assert report["events"][2][1 + UPLOAD] == 0
+
+
+def test_ring_buffer_drops_old_events(trace: LatencyTrace):
+    old = trace.begin()
+    for _ in range(4):
+        trace.begin()
+    trace.stamp(old, DEQUEUE)
+    assert trace.events[:, 1 + DEQUEUE].sum() == 0
+    assert sorted(trace.events[:, 0]) == [2, 3, 4, 5]
+    assert trace.stage_latencies() == {}
@@ -0,0 +1,52 @@
+from pathlib import Path
+
+import numpy as np
+
+from chip8 import Machine
+from chip8.cache import RomCache, rom_hash
+from chip8.library import RomLibrary, build_library, rom_title
+from chip8.memory import MEMORY_START_ROM, Memory
+
+# V0 = V0 SHR 1, jump back
+SHIFT_ROM = bytes.fromhex("8006 1200")
+# I = 0x300, store V0, loop
+STORE_ROM = bytes.fromhex("A300 F055 1204")
+
+
+def test_rom_title():
+    assert rom_title(Path("Tetris [Fran Dachille, 1991].ch8")) == "Tetris"
+    assert rom_title(Path("Maze (alt) [David Winter, 199x].ch8")) == "Maze"
+    assert rom_title(Path("wipeoff.rom")) == "wipeoff"
+
+
+def test_build_and_load(tmp_path: Path):
+    roms = tmp_path / "roms"
+    (roms / "more").mkdir(parents=True)
+    (roms / "Shift [test].ch8").write_bytes(SHIFT_ROM)
+    (roms / "more" / "store.rom").write_bytes(STORE_ROM)
+    (roms / "more" / "store (copy).c8").write_bytes(STORE_ROM)
+    (roms / "notes.txt").write_bytes(b"not a rom")
+    archive = tmp_path / "library" / "roms.lib"
+    cache = RomCache(tmp_path / "cache")
+    build_library([roms], archive, cache)
+    assert cache.read(rom_hash(np.frombuffer(STORE_ROM, dtype=np.uint8))) is not None
+
+    library = RomLibrary(archive)
+    assert len(library.roms) == 2
+    assert archive.stat().st_size == len(SHIFT_ROM) + len(STORE_ROM)
+    [shift] = library.find("shift")
+    [store] = library.find("STORE")
+    assert library.roms[shift]["quirks"] == ["shift"]
+    assert library.roms[shift]["histogram"] == {"1nnn": 1, "8xy6": 1}
+    assert library.roms[store]["quirks"] == ["index_increment"]
+    assert sorted(library.roms[store]["files"]) == ["store (copy).c8", "store.rom"]
+    assert isinstance(library.rom(store).base, np.memmap)
+
+    memory = Memory()
+    library.load_into(memory, store)
+    assert memory.memory[MEMORY_START_ROM : MEMORY_START_ROM + len(STORE_ROM)].tobytes() == STORE_ROM
+
+    machine = Machine()
+    machine.load(library.rom(shift))
+    machine.step(2)
+    assert machine.cpu.register_PC == 0x200
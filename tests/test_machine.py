@@ -0,0 +1,58 @@
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+from chip8 import Machine
+
+# V1 = 0, V0 = 5, I = font sprite of V0, draw it at (V1, V1), loop forever
+DRAW_DIGIT_ROM = bytes.fromhex("6100 6005 F029 D115 1208")
+# V0 = 3, skip next instruction if key V0 is pressed
+SKIP_ON_KEY_ROM = bytes.fromhex("6003 E09E 6101 6102")
+
+
+@pytest.fixture
+def machine() -> Machine:
+    return Machine()
+
+
+def test_framebuffer_is_a_live_read_only_view(machine: Machine):
+    framebuffer = machine.framebuffer
+    machine.load(DRAW_DIGIT_ROM)
+    machine.step(4)
+    assert machine.framebuffer is framebuffer
+    assert framebuffer[0, :8].tolist() == [True] * 4 + [False] * 4
+    assert framebuffer.sum() == 14
+    with pytest.raises(ValueError, match="read-only"):
+        framebuffer[0, 0] = False
+
+    machine.reset()
+    assert not framebuffer.any()
+
+
+def test_run_frames(machine: Machine):
+    machine.load(DRAW_DIGIT_ROM)
+    machine.run_frames(2)
+    assert machine.cpu.register_PC == 0x208
+    assert np.count_nonzero(machine.framebuffer) == 14
+
+
+@pytest.mark.parametrize(("mask", "pc"), [(0, 0x204), (1 << 3, 0x206), (1 << 4, 0x204)])
+def test_set_keys(machine: Machine, mask: int, pc: int):
+    machine.load(SKIP_ON_KEY_ROM)
+    machine.set_keys(mask)
+    machine.step(2)
+    assert machine.cpu.register_PC == pc
+
+
+def test_load_replaces_previous_rom(machine: Machine):
+    machine.load(DRAW_DIGIT_ROM)
+    machine.load(SKIP_ON_KEY_ROM[:4])
+    assert machine.memory.read_bytes(np.uint16(0x204), np.uint8(6)).tolist() == [0] * 6
+
+
+def test_core_does_not_import_frontends():
+    code = "import sys, chip8; print(sorted(m for m in sys.modules if m.split('.')[0] in ('PIL', 'imgui', 'termios')))"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)  # noqa: S603
+    assert result.stdout.strip() == "[]"
@@ -0,0 +1,61 @@
+import numpy as np
+import pytest
+
+from chip8.cpu import CPU
+from chip8.debug import DebugInformation
+from chip8.monitor import BYTES_PER_ROW, EXECUTE, READ, WRITE, MemoryMonitor, TracedMemory
+from chip8.screen import Screen
+from chip8.sound import SilentSound
+
+
+@pytest.fixture
+def monitor():
+    monitor = MemoryMonitor()
+    yield monitor
+    monitor.close()
+    monitor.unlink()
+
+
+def test_traced_memory_counts_accesses(monitor: MemoryMonitor):
+    memory = TracedMemory(monitor)
+    # I = 0x300, store V0 and V1, load V0
+    memory.load_rom(np.frombuffer(bytes.fromhex("A300 F155 F065"), dtype=np.uint8))
+    cpu = CPU(memory, Screen(), SilentSound())
+    for _ in range(3):
+        cpu.tick()
+
+    assert monitor.memory[0x200] == 0xA3
+    assert monitor.heat[EXECUTE, 0x200:0x206].tolist() == [1] * 6
+    assert monitor.heat[WRITE, 0x300:0x303].tolist() == [1, 1, 0]
+    assert monitor.heat[READ, 0x300:0x303].tolist() == [1, 0, 0]
+    assert monitor.heat.sum() == 9
+
+
+def test_debug_info_does_not_count_as_execution(monitor: MemoryMonitor):
+    memory = TracedMemory(monitor)
+    # V0 = 1, V1 = 2, V2 = 3, draw V0 V1
+    memory.load_rom(np.frombuffer(bytes.fromhex("6001 6102 6203 D011"), dtype=np.uint8))
+    cpu = CPU(memory, Screen(), SilentSound(), DebugInformation())
+    for _ in range(3):
+        cpu.tick()
+        cpu.publish_debug_info()
+    cpu.run_until_draw()
+
+    assert monitor.heat[EXECUTE, 0x200:0x208].tolist() == [1] * 8
+
+
+def test_heat_map_decays(monitor: MemoryMonitor):
+    monitor.heat[READ, 65] = 1000
+    rgb = np.frombuffer(monitor.heat_rgb(), dtype=np.uint8).reshape(64, 64, 3)
+    assert rgb[1, 1].tolist() == [0, 255, 0]
+    assert rgb.sum() == 255
+
+    for _ in range(400):
+        monitor.decay()
+    assert not monitor.heat_rgb().strip(b"\0")
+
+
+def test_hex_rows(monitor: MemoryMonitor):
+    monitor.memory[BYTES_PER_ROW : 2 * BYTES_PER_ROW] = range(0xF0, 0x100)
+    assert monitor.hex_rows(1, 2) == ["0x010  F0 F1 F2 F3 F4 F5 F6 F7 F8 F9 FA FB FC FD FE FF"]
+    assert len(monitor.hex_rows(0, 256)) == 256
@@ -0,0 +1,43 @@
+import numpy as np
+import pytest
+
+from chip8 import Machine
+from chip8.quirks import QUIRK_PROFILES
+
+
+def run(rom: str, profile: str, steps: int) -> Machine:
+    machine = Machine(quirks=QUIRK_PROFILES[profile])
+    machine.load(bytes.fromhex(rom))
+    machine.step(steps)
+    return machine
+
+
+@pytest.mark.parametrize(("profile", "expected"), [("default", 0x02), ("cosmac-vip", 0x40), ("super-chip", 0x02)])
+def test_shift(profile: str, expected: int):
+    # V0 = 0x04, V1 = 0x81, V0 = V0 SHR 1 or V0 = V1 SHR 1
+    machine = run("6004 6181 8016", profile, 3)
+    assert machine.cpu.data_registers[0] == expected
+    assert machine.cpu.data_registers[0xF] == (1 if profile == "cosmac-vip" else 0)
+
+
+@pytest.mark.parametrize(("profile", "expected"), [("default", 0x300), ("cosmac-vip", 0x303), ("chip-48", 0x302)])
+def test_store_registers_index(profile: str, expected: int):
+    # I = 0x300, store V0 through V2
+    machine = run("A300 F255", profile, 2)
+    assert machine.cpu.register_I == expected
+
+
+@pytest.mark.parametrize(("profile", "expected"), [("default", 0x312), ("cosmac-vip", 0x312), ("chip-48", 0x322)])
+def test_jump_with_offset(profile: str, expected: int):
+    # V0 = 0x12, V3 = 0x22, JP V0 0x300 (or JP V3 0x300)
+    machine = run("6012 6322 B300", profile, 3)
+    assert machine.cpu.register_PC == expected
+
+
+@pytest.mark.parametrize(("profile", "wrapped_pixels"), [("default", 7), ("cosmac-vip", 0)])
+def test_sprite_clipping(profile: str, wrapped_pixels: int):
+    # V0 = 62, I = font sprite for 0, draw at (62, 0), the right half of the sprite is off the screen
+    machine = run("603E A000 D015", profile, 3)
+    assert np.count_nonzero(machine.framebuffer[:, 62:]) == 7
+    assert np.count_nonzero(machine.framebuffer[:, :2]) == wrapped_pixels
+    assert np.count_nonzero(machine.framebuffer) == 7 + wrapped_pixels
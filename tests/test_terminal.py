@@ -0,0 +1,47 @@
+import io
+
+import numpy as np
+
+from chip8.constants import HEIGHT, WIDTH
+from chip8.terminal import KEY_HOLD_TICKS, TerminalDisplay, render_rows
+
+
+def test_render_rows_uses_half_blocks():
+    screen = np.zeros((HEIGHT, WIDTH), dtype=np.bool_)
+    screen[0, 0] = screen[1, 1] = True
+    screen[0, 2] = screen[1, 2] = True
+    rows = render_rows(screen)
+    assert len(rows) == HEIGHT // 2
+    assert rows[0][:4] == "▀▄█ "
+    assert rows[1] == " " * WIDTH
+
+
+def test_show_redraws_only_changed_rows():
+    output = io.StringIO()
+    display = TerminalDisplay(output=output, keyboard=io.StringIO())
+    display.show()
+    output.truncate(0)
+    output.seek(0)
+    display.show()
+    assert output.getvalue() == ""
+
+    display.blit(np.uint8(0), np.uint8(5), np.asarray([0xFF], dtype=np.uint8))
+    display.show()
+    assert output.getvalue() == "\x1b[4;2H" + "▄" * 8 + " " * (WIDTH - 8)
+
+
+def test_pressed_keys_are_held_for_some_ticks():
+    display = TerminalDisplay(output=io.StringIO(), keyboard=io.StringIO())
+    display.press("aQ")
+    assert display.pressed_buttons() == {0xA, -1}
+    for _ in range(KEY_HOLD_TICKS):
+        display.show()
+    assert display.pressed_buttons() == set()
+
+
+def test_escape_sequences_are_skipped():
+    display = TerminalDisplay(output=io.StringIO(), keyboard=io.StringIO())
+    display.press("\x1b[A1\x1b[1;5C2\x1bOB3")
+    assert display.pressed_buttons() == {1, 2, 3}
+    display.press("\x1b")
+    assert display.pressed_buttons() == {1, 2, 3, -1}